@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS status_sync_state (
+  title TEXT NOT NULL,
+  lang TEXT NOT NULL,
+  source_rev BIGINT NOT NULL,
+  translated_rev BIGINT NOT NULL,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (title, lang)
+);
@@ -4,19 +4,14 @@ import argparse
 import logging
 import time
 
-import requests
-
 from .config import load_config
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient
+from .mediawiki import TITLES_PER_QUERY, MediaWikiClient, build_session
+from .sync_translation_status import iter_source_revisions
 from .translate_page import (
-    _collapse_blank_lines,
-    _compact_leading_metadata_preamble,
-    _normalize_leading_directives,
-    _normalize_leading_div,
-    _normalize_leading_status_directives,
+    _equal_ignoring_edge_ws,
+    _normalize_unit1,
     _parse_status_template,
-    _remove_disclaimer_tables,
     _translation_status_from_ai_info,
     _translation_status_from_props,
     _translation_status_from_unit1,
@@ -28,15 +23,6 @@ from .translate_page import (
 log = logging.getLogger("bot.backfill_ai_translation_props")
 
 
-def _normalize_unit1(text: str) -> str:
-    text = _remove_disclaimer_tables(text)
-    text = _normalize_leading_directives(text)
-    text = _normalize_leading_status_directives(text)
-    text = _normalize_leading_div(text)
-    text = _compact_leading_metadata_preamble(text)
-    return _collapse_blank_lines(text)
-
-
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--only-title")
@@ -57,7 +43,7 @@ def main() -> None:
     if not langs:
         raise SystemExit("no languages configured")
 
-    client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, requests.Session())
+    client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, build_session(cfg.mw_user_agent))
     client.login(cfg.mw_username, cfg.mw_password)
 
     titles = [args.only_title] if args.only_title else client.iter_translation_base_titles(source_lang=cfg.source_lang)
@@ -69,11 +55,10 @@ def main() -> None:
     template_edited = 0
     errors = 0
 
-    for base in titles:
-        try:
-            source_rev, norm_title = client.get_page_revision_id(base)
-        except Exception:
-            continue
+    title_batches = (
+        titles[start : start + TITLES_PER_QUERY] for start in range(0, len(titles), TITLES_PER_QUERY)
+    )
+    for source_rev, norm_title, translated_pages in iter_source_revisions(client, title_batches, langs):
         source_rev_s = str(source_rev)
 
         for lang in langs:
@@ -85,9 +70,7 @@ def main() -> None:
                 return
 
             translated_title = f"{norm_title}/{lang}"
-            try:
-                client.get_page_revision_id(translated_title)
-            except Exception:
+            if translated_title not in translated_pages:
                 missing += 1
                 continue
 
@@ -96,7 +79,7 @@ def main() -> None:
                 ai_info = client.get_ai_translation_info(translated_title)
             except Exception:
                 ai_info = {}
-            props, _, _ = client.get_page_props(translated_title)
+            _, props = translated_pages[translated_title]
             status_meta = _translation_status_from_ai_info(ai_info)
             status_meta = {**_translation_status_from_props(props), **status_meta}
             if "dr_translation_status" not in status_meta:
@@ -169,7 +152,7 @@ def main() -> None:
                 status=desired_status,
             )
             updated = _normalize_unit1(updated)
-            if updated.strip() == unit1_text.strip():
+            if _equal_ignoring_edge_ws(updated, unit1_text):
                 continue
             if args.dry_run:
                 log.info("DRY RUN edit %s", unit1_title)
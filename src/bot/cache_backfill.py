@@ -6,7 +6,7 @@ import logging
 from .config import load_config
 from .db import get_conn, upsert_segment, upsert_translation
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient, MediaWikiError
+from .mediawiki import MediaWikiClient, MediaWikiError, build_session
 from .translate_page import _checksum
 from .ingest import is_translation_subpage
 
@@ -58,7 +58,7 @@ def main() -> None:
     if args.langs:
         langs = tuple(lang.strip() for lang in args.langs.split(",") if lang.strip())
 
-    session = __import__("requests").Session()
+    session = build_session(cfg.mw_user_agent)
     client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
     client.login(cfg.mw_username, cfg.mw_password)
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import json
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass(frozen=True)
@@ -48,6 +49,22 @@ class Config:
     )
     cache_strict_templates: tuple[str, ...] = ()
 
+    # Derived once per config; cached_property writes to the instance dict
+    # directly, so it works on this frozen dataclass.
+    @cached_property
+    def target_langs_sorted(self) -> tuple[str, ...]:
+        return tuple(sorted(set(self.target_langs)))
+
+    @cached_property
+    def engine_langs(self) -> dict[str, str]:
+        return {lang: engine_lang_for(lang) for lang in self.target_langs}
+
+
+def engine_lang_for(lang: str) -> str:
+    if lang == "sr":
+        return "sr-Latn"
+    return lang
+
 
 def load_config() -> Config:
     def _load_mark_params() -> dict[str, str] | None:
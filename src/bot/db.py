@@ -1,29 +1,64 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import threading
 from contextlib import contextmanager
 from typing import Iterator
 
 import psycopg
+from psycopg_pool import ConnectionPool
 
 log = logging.getLogger("bot.db")
 
+POOL_MIN_SIZE = 1
+POOL_MAX_SIZE = 8
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
 
 def connect(dsn: str) -> psycopg.Connection:
     return psycopg.connect(dsn)
 
 
+def get_pool(dsn: str) -> ConnectionPool:
+    # One process-wide pool per DSN, opened on first use so commands that never
+    # touch the database do not connect at import time.
+    pool = _pools.get(dsn)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        pool = _pools.get(dsn)
+        if pool is None:
+            pool = ConnectionPool(
+                dsn,
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                open=True,
+                name="bot",
+            )
+            _pools[dsn] = pool
+    return pool
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_pools)
+
+
 @contextmanager
 def get_conn(dsn: str) -> Iterator[psycopg.Connection]:
-    conn = connect(dsn)
-    try:
+    # The pool commits on success, rolls back on error and keeps the
+    # connection open for the next caller.
+    with get_pool(dsn).connection() as conn:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
 
 
 def ensure_schema(dsn: str) -> None:
@@ -130,6 +165,51 @@ def fetch_cached_translation_by_checksum(
     return row[0]
 
 
+def fetch_cached_translations(
+    conn: psycopg.Connection, checksums_by_segment_key: dict[str, str], lang: str
+) -> dict[str, str]:
+    if not checksums_by_segment_key:
+        return {}
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT segment_key, source_checksum, text
+            FROM translations
+            WHERE segment_key = ANY(%s)
+              AND lang = %s
+            """,
+            (list(checksums_by_segment_key), lang),
+        )
+        rows = cur.fetchall()
+    return {
+        segment_key: text
+        for segment_key, source_checksum, text in rows
+        if checksums_by_segment_key.get(segment_key) == source_checksum
+    }
+
+
+def fetch_cached_translations_by_checksum(
+    conn: psycopg.Connection, checksums: list[str], lang: str
+) -> dict[str, str]:
+    unique = list(dict.fromkeys(checksums))
+    if not unique:
+        return {}
+    # Latest translation per checksum, same as fetch_cached_translation_by_checksum.
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT DISTINCT ON (source_checksum) source_checksum, text
+            FROM translations
+            WHERE source_checksum = ANY(%s)
+              AND lang = %s
+            ORDER BY source_checksum, created_at DESC
+            """,
+            (unique, lang),
+        )
+        rows = cur.fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
 def upsert_translation(
     conn: psycopg.Connection,
     segment_key: str,
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .base import TranslationResult
+
+
+@dataclass
+class PassthroughEngine:
+    # Returns the input unchanged; used for dry runs so no MT calls are billed.
+    name: str = "passthrough"
+
+    def translate(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        glossary_id: str | None = None,
+    ) -> list[TranslationResult]:
+        return [TranslationResult(text=text, engine=self.name) for text in texts]
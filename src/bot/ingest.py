@@ -3,15 +3,18 @@ from __future__ import annotations
 import logging
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from .config import Config
 from .mediawiki import MediaWikiClient, MediaWikiError
-from .tracker import get_page
+from .tracker import PageRecord, get_page, get_pages
 from .jobs import enqueue_job
 from .state import get_ingest_cursor, set_ingest_cursor
 
 log = logging.getLogger("bot.ingest")
 
+LANG_SUFFIX_RE = re.compile(r"[a-z]{2,3}(?:-[a-z0-9]+)*")
+
 
 def is_main_namespace(title: str) -> bool:
     return ":" not in title
@@ -47,7 +50,7 @@ def is_translation_subpage(title: str, target_langs: tuple[str, ...]) -> bool:
     suffix = title.split("/")[-1]
     if suffix in target_langs:
         return True
-    if re.fullmatch(r"[a-z]{2,3}(?:-[a-z0-9]+)*", suffix):
+    if LANG_SUFFIX_RE.fullmatch(suffix):
         return True
     return False
 
@@ -94,6 +97,8 @@ def ingest_title(
     force: bool = False,
     dry_run: bool = False,
     enqueue_missing_when_unchanged: bool = True,
+    revision: tuple[int, str] | None = None,
+    page_records: dict[str, PageRecord | None] | None = None,
 ) -> None:
     record_cb = record
     would_queue = False
@@ -106,8 +111,13 @@ def ingest_title(
         if dry_run and would_queue and record_cb is not None:
             record_cb("plan", "queue", title, None, "would queue translation")
 
-    rev_id, norm_title = client.get_page_revision_id(title)
-    page_record = get_page(conn, norm_title)
+    if revision is None:
+        revision = client.get_page_revision_id(title)
+    rev_id, norm_title = revision
+    if page_records is not None and norm_title in page_records:
+        page_record = page_records[norm_title]
+    else:
+        page_record = get_page(conn, norm_title)
 
     if should_skip_title(norm_title, cfg.skip_title_prefixes):
         log.info("skip translation for %s due to prefix rule", norm_title)
@@ -257,6 +267,36 @@ def ingest_title(
     _record_plan_queue()
 
 
+def ingest_titles_bulk(
+    cfg: Config,
+    client: MediaWikiClient,
+    conn,
+    titles: list[str],
+    record=None,
+    force: bool = False,
+) -> None:
+    # One revisions query per batch of titles instead of one per title.
+    titles = list(dict.fromkeys(titles))
+    revisions = client.get_page_revision_ids(titles)
+    page_records = get_pages(conn, (norm_title for _, norm_title in revisions.values()))
+    for title in titles:
+        try:
+            ingest_title(
+                cfg,
+                client,
+                conn,
+                title,
+                record=record,
+                force=force,
+                revision=revisions.get(title),
+                page_records=page_records,
+            )
+        except Exception as exc:
+            log.error("ingest failed for %s: %s", title, exc)
+            if record is not None:
+                record("ingest", "error", title, None, f"exception: {exc}")
+
+
 def ingest_all(
     cfg: Config,
     client: MediaWikiClient,
@@ -266,32 +306,62 @@ def ingest_all(
     record=None,
     force: bool = False,
     dry_run: bool = False,
+    prefetch: bool = False,
 ) -> None:
     cursor = get_ingest_cursor(conn, "main")
     processed = 0
     page_size = 1 if limit is not None else 200
-    while True:
-        titles, next_cursor = client.all_pages_page(
-            namespace=0, limit=page_size, apcontinue=cursor
-        )
-        if not titles:
-            break
-        for title in titles:
-            try:
-                ingest_title(cfg, client, conn, title, record=record, force=force, dry_run=dry_run)
-            except Exception as exc:
-                log.error("ingest failed for %s: %s", title, exc)
-                if record is not None:
-                    record("ingest", "error", title, None, f"exception: {exc}")
-            processed += 1
-            if limit is not None and processed >= limit:
-                if not dry_run:
-                    set_ingest_cursor(conn, "main", next_cursor)
-                return
-            if sleep_ms > 0:
-                time.sleep(sleep_ms / 1000.0)
-        cursor = next_cursor
-        if not dry_run:
-            set_ingest_cursor(conn, "main", cursor)
-        if not cursor:
-            break
+    # Fetch the next allpages batch in the background while the current one is
+    # ingested. Limited runs stop after a few titles, so they stay sequential.
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch and limit is None else None
+    pending = None
+    try:
+        while True:
+            if pending is not None:
+                titles, next_cursor = pending.result()
+                pending = None
+            else:
+                titles, next_cursor = client.all_pages_page(
+                    namespace=0, limit=page_size, apcontinue=cursor
+                )
+            if not titles:
+                break
+            if executor is not None and next_cursor:
+                pending = executor.submit(
+                    client.all_pages_page,
+                    namespace=0,
+                    limit=page_size,
+                    apcontinue=next_cursor,
+                )
+            page_records = get_pages(conn, titles)
+            for title in titles:
+                try:
+                    ingest_title(
+                        cfg,
+                        client,
+                        conn,
+                        title,
+                        record=record,
+                        force=force,
+                        dry_run=dry_run,
+                        page_records=page_records,
+                    )
+                except Exception as exc:
+                    log.error("ingest failed for %s: %s", title, exc)
+                    if record is not None:
+                        record("ingest", "error", title, None, f"exception: {exc}")
+                processed += 1
+                if limit is not None and processed >= limit:
+                    if not dry_run:
+                        set_ingest_cursor(conn, "main", next_cursor)
+                    return
+                if sleep_ms > 0:
+                    time.sleep(sleep_ms / 1000.0)
+            cursor = next_cursor
+            if not dry_run:
+                set_ingest_cursor(conn, "main", cursor)
+            if not cursor:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
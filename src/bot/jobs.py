@@ -55,21 +55,78 @@ def enqueue_job(
         )
 
 
-def next_jobs(conn: psycopg.Connection, limit: int = 10) -> list[Job]:
+def next_jobs(
+    conn: psycopg.Connection, limit: int = 10, after_id: int | None = None
+) -> list[Job]:
+    # Claim and return the batch in one statement: the rows flip to 'running'
+    # so the claim survives the end of this transaction and the caller can
+    # release its connection while working. after_id restricts the claim to
+    # jobs created after that id.
+    after_clause = "AND id > %s" if after_id is not None else ""
+    params = (after_id, limit) if after_id is not None else (limit,)
     with conn.cursor() as cur:
         cur.execute(
-            """
-            SELECT id, type, page_title, lang, status, priority, retries
-            FROM jobs
-            WHERE status = 'queued'
-            ORDER BY priority DESC, id ASC
-            LIMIT %s
-            FOR UPDATE SKIP LOCKED
+            f"""
+            WITH peek AS (
+                SELECT id
+                FROM jobs
+                WHERE status = 'queued' {after_clause}
+                ORDER BY priority DESC, id ASC
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE jobs
+            SET status = 'running', updated_at = NOW()
+            WHERE id = ANY(ARRAY(SELECT id FROM peek))
+            RETURNING id, type, page_title, lang, status, priority, retries
             """,
-            (limit,),
+            params,
         )
         rows = cur.fetchall()
-        return [Job(*row) for row in rows]
+    jobs = [Job(*row) for row in rows]
+    jobs.sort(key=lambda job: (-job.priority, job.id))
+    return jobs
+
+
+def requeue_running_jobs(conn: psycopg.Connection) -> int:
+    # Jobs left 'running' by an interrupted worker go back to the queue unless
+    # a newer queued job for the same page/lang already exists.
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE jobs AS j
+            SET status = 'queued', updated_at = NOW()
+            WHERE j.id IN (
+                SELECT DISTINCT ON (type, page_title, lang) id
+                FROM jobs
+                WHERE status = 'running'
+                ORDER BY type, page_title, lang, id DESC
+            )
+            AND NOT EXISTS (
+                SELECT 1
+                FROM jobs AS q
+                WHERE q.status = 'queued'
+                  AND q.type = j.type
+                  AND q.page_title = j.page_title
+                  AND q.lang = j.lang
+            )
+            """
+        )
+        requeued = int(cur.rowcount)
+        cur.execute(
+            """
+            UPDATE jobs
+            SET status = 'error', error = 'interrupted; superseded by queued job', updated_at = NOW()
+            WHERE status = 'running'
+            """
+        )
+    return requeued
+
+
+def max_job_id(conn: psycopg.Connection) -> int:
+    with conn.cursor() as cur:
+        cur.execute("SELECT COALESCE(MAX(id), 0) FROM jobs")
+        return int(cur.fetchone()[0])
 
 
 def count_jobs(
@@ -5,11 +5,42 @@ from dataclasses import dataclass
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup (the "speedups" extra)
+    from json import loads as _json_loads
 
 
 log = logging.getLogger("bot.mediawiki")
 
 TRANSLATIONS_PREFIX = "Translations:"
+# Upper bound on titles= for non-bot-flagged API users.
+TITLES_PER_QUERY = 50
+HTTP_POOL_MAXSIZE = 32
+
+
+def build_session(user_agent: str | None = None) -> requests.Session:
+    # One keep-alive pool sized for the concurrent scripts; transport-level
+    # retries sit below the API-level rate-limit handling in _request.
+    # Only GETs are retried on read errors and 5xx: a POST (edit, approve,
+    # review, login) may already have been applied. urllib3 still retries
+    # connect errors for every method, since nothing was sent.
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if user_agent:
+        session.headers["User-Agent"] = user_agent
+    return session
 
 
 def parse_translation_unit_title(title: str, source_lang: str) -> str | None:
@@ -52,7 +83,7 @@ class MediaWikiClient:
             else:
                 resp = self.session.post(self.api_url, data=params, headers=headers, timeout=30)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             if "error" not in data:
                 return data
             error = data["error"]
@@ -116,6 +147,26 @@ class MediaWikiClient:
         data = self._request("GET", params)
         return data["query"]["recentchanges"]
 
+    def recentchanges_latest_timestamp(self, namespace: int = 0) -> str | None:
+        # Same filters as the recentchanges poller so bot edits do not move the mark.
+        data = self._request(
+            "GET",
+            {
+                "action": "query",
+                "list": "recentchanges",
+                "rcprop": "timestamp",
+                "rctype": "edit|new",
+                "rcshow": "!bot",
+                "rcnamespace": namespace,
+                "rclimit": 1,
+                "rcdir": "older",
+            },
+        )
+        items = data.get("query", {}).get("recentchanges", [])
+        if not items:
+            return None
+        return items[0].get("timestamp")
+
     def get_page_wikitext(self, title: str) -> tuple[str, int, str]:
         data = self._request(
             "GET",
@@ -156,6 +207,53 @@ class MediaWikiClient:
         rev = revisions[0]
         return int(rev["revid"]), normalized_title
 
+    def _query_pages(self, titles: list[str], params: dict[str, Any]):
+        # Yields (requested_title, page) per chunk of titles; missing or invalid
+        # pages are left out.
+        for start in range(0, len(titles), TITLES_PER_QUERY):
+            chunk = titles[start : start + TITLES_PER_QUERY]
+            data = self._request(
+                "GET",
+                {"action": "query", "titles": "|".join(chunk), **params},
+            )
+            query = data.get("query", {})
+            normalized = {
+                item.get("from"): item.get("to") for item in query.get("normalized", [])
+            }
+            pages = {page.get("title"): page for page in query.get("pages", [])}
+            for title in chunk:
+                page = pages.get(normalized.get(title, title))
+                if not page or page.get("missing") or page.get("invalid"):
+                    continue
+                yield title, page
+
+    def get_page_revision_ids(self, titles: list[str]) -> dict[str, tuple[int, str]]:
+        # Keyed by the requested title.
+        out: dict[str, tuple[int, str]] = {}
+        for title, page in self._query_pages(titles, {"prop": "revisions", "rvprop": "ids"}):
+            revisions = page.get("revisions") or []
+            if revisions:
+                out[title] = (int(revisions[0]["revid"]), page.get("title", title))
+        return out
+
+    def get_pages_wikitext(self, titles: list[str]) -> dict[str, str]:
+        # Keyed by the requested title. Pages whose content was cut off by the
+        # API result size limit come back without revisions and are left out.
+        out: dict[str, str] = {}
+        params = {"prop": "revisions", "rvprop": "content", "rvslots": "main"}
+        for title, page in self._query_pages(titles, params):
+            revisions = page.get("revisions") or []
+            if revisions:
+                out[title] = revisions[0]["slots"]["main"]["content"]
+        return out
+
+    def get_page_props_bulk(self, titles: list[str]) -> dict[str, dict[str, Any]]:
+        # Keyed by the requested title.
+        return {
+            title: page.get("pageprops") or {}
+            for title, page in self._query_pages(titles, {"prop": "pageprops"})
+        }
+
     def get_page_props(self, title: str) -> tuple[dict[str, Any], str, bool]:
         data = self._request(
             "GET",
@@ -271,6 +369,23 @@ class MediaWikiClient:
                 break
         return sorted(set(titles))
 
+    def iter_main_namespace_title_batches(self, batch_size: int = TITLES_PER_QUERY):
+        # Streams allpages in title order as lists of batch_size titles, so
+        # callers can start bulk lookups before the listing is complete.
+        batch: list[str] = []
+        apcontinue = None
+        while True:
+            titles, apcontinue = self.all_pages_page(namespace=0, limit=500, apcontinue=apcontinue)
+            for title in titles:
+                batch.append(title)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if not apcontinue:
+                break
+        if batch:
+            yield batch
+
     def get_message_collection(
         self, group_id: str, lang: str, include_properties: bool = False
     ) -> list[dict[str, Any]]:
@@ -354,7 +469,7 @@ class MediaWikiClient:
             key_set = set()
 
         if key_set:
-            return sorted(key_set, key=lambda k: int(k))
+            return sorted(key_set, key=int)
 
         apcontinue = None
         prefix = f"{norm_title}/"
@@ -381,7 +496,7 @@ class MediaWikiClient:
             apcontinue = data.get("continue", {}).get("apcontinue")
             if not apcontinue:
                 break
-        return sorted(key_set, key=lambda k: int(k))
+        return sorted(key_set, key=int)
 
     def translation_review(self, revision_id: int) -> None:
         if not self.csrf_token:
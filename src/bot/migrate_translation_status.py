@@ -3,11 +3,9 @@ from __future__ import annotations
 import argparse
 import logging
 
-import requests
-
 from .config import load_config
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient, MediaWikiError
+from .mediawiki import MediaWikiClient, MediaWikiError, build_session
 from .translate_page import (
     _collapse_blank_lines,
     _normalize_leading_directives,
@@ -46,7 +44,7 @@ def main() -> None:
     if not langs:
         raise SystemExit("no languages configured")
 
-    session = requests.Session()
+    session = build_session(cfg.mw_user_agent)
     client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
     client.login(cfg.mw_username, cfg.mw_password)
 
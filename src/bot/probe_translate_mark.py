@@ -6,7 +6,7 @@ import logging
 
 from .config import load_config
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient
+from .mediawiki import MediaWikiClient, build_session
 
 
 def _parse_params(items: list[str]) -> dict[str, str]:
@@ -37,7 +37,7 @@ def main() -> None:
     configure_logging()
     cfg = load_config()
 
-    session = __import__("requests").Session()
+    session = build_session(cfg.mw_user_agent)
     client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
     client.login(cfg.mw_username, cfg.mw_password)
 
@@ -6,7 +6,7 @@ import logging
 
 from .config import load_config
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient, MediaWikiError
+from .mediawiki import MediaWikiClient, MediaWikiError, build_session
 
 
 def _guess_group_id(title: str) -> str:
@@ -21,7 +21,7 @@ def main() -> None:
     configure_logging()
     cfg = load_config()
 
-    session = __import__("requests").Session()
+    session = build_session(cfg.mw_user_agent)
     client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
     client.login(cfg.mw_username, cfg.mw_password)
 
@@ -7,7 +7,7 @@ import logging
 from .config import load_config
 from .engines.google_v3 import GoogleTranslateV3
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient
+from .mediawiki import MediaWikiClient, build_session
 from .segmenter import split_translate_units
 
 
@@ -34,7 +34,7 @@ def main() -> None:
     configure_logging()
     cfg = load_config()
 
-    session = __import__("requests").Session()
+    session = build_session(cfg.mw_user_agent)
     client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
     client.login(cfg.mw_username, cfg.mw_password)
 
@@ -4,13 +4,11 @@ import argparse
 import logging
 import time
 
-import requests
-
-from .config import load_config
+from .config import engine_lang_for, load_config
 from .db import fetch_termbase, get_conn
 from .engines.google_v3 import GoogleTranslateV3
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient
+from .mediawiki import MediaWikiClient, build_session
 from .translate_page import (
     DISPLAYTITLE_RE,
     _apply_termbase,
@@ -32,12 +30,6 @@ log = logging.getLogger("bot.repair_display_titles")
 NAME_STOPWORDS = {"and", "to", "of", "for", "in", "on", "our", "the", "&"}
 
 
-def _engine_lang_for(lang: str) -> str:
-    if lang == "sr":
-        return "sr-Latn"
-    return lang
-
-
 def _find_current_page_display_title(
     client: MediaWikiClient,
     norm_title: str,
@@ -106,7 +98,7 @@ def main() -> None:
     if not langs:
         raise SystemExit("no target languages configured")
 
-    session = requests.Session()
+    session = build_session(cfg.mw_user_agent)
     client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
     client.login(cfg.mw_username, cfg.mw_password)
 
@@ -125,6 +117,8 @@ def main() -> None:
     repaired = 0
     skipped = 0
     errors = 0
+    # The termbase is stable for the length of a run; load it once per language.
+    termbase_by_lang: dict[str, tuple[list[dict[str, str | bool | None]], list[tuple[str, str]]]] = {}
 
     for base in titles:
         try:
@@ -158,14 +152,16 @@ def main() -> None:
                 skipped += 1
                 continue
 
-            termbase_entries = []
-            if cfg.pg_dsn:
-                try:
-                    with get_conn(cfg.pg_dsn) as conn:
-                        termbase_entries = fetch_termbase(conn, lang)
-                except Exception:
-                    termbase_entries = []
-            no_translate_terms = _build_no_translate_terms(termbase_entries)
+            if lang not in termbase_by_lang:
+                termbase_entries = []
+                if cfg.pg_dsn:
+                    try:
+                        with get_conn(cfg.pg_dsn) as conn:
+                            termbase_entries = fetch_termbase(conn, lang)
+                    except Exception:
+                        termbase_entries = []
+                termbase_by_lang[lang] = (termbase_entries, _build_no_translate_terms(termbase_entries))
+            termbase_entries, no_translate_terms = termbase_by_lang[lang]
 
             target_display = None
             for term, preferred in no_translate_terms:
@@ -176,7 +172,7 @@ def main() -> None:
                 out = engine.translate(
                     [source_display],
                     cfg.source_lang,
-                    _engine_lang_for(lang),
+                    engine_lang_for(lang),
                     glossary_id=(cfg.gcp_glossaries or {}).get(lang) if cfg.gcp_glossaries else None,
                 )[0].text
                 target_display = sr_cyrillic_to_latin(out) if lang == "sr" else out
@@ -96,6 +96,45 @@ def log_item(
         )
 
 
+class LogBuffer:
+    # Collects run_items rows in memory and writes them with one executemany,
+    # so hot loops do not pay a round trip per logged item.
+    def __init__(self, run_id: int | None, max_rows: int = 100) -> None:
+        self.run_id = run_id
+        self.max_rows = max_rows
+        self.rows: list[tuple[int, str, str | None, str | None, str, str | None]] = []
+
+    @property
+    def full(self) -> bool:
+        return len(self.rows) >= self.max_rows
+
+    def add(
+        self,
+        kind: str,
+        status: str,
+        page_title: str | None = None,
+        lang: str | None = None,
+        message: str | None = None,
+    ) -> None:
+        if self.run_id is None:
+            return
+        self.rows.append((self.run_id, kind, page_title, lang, status, message))
+
+    def flush(self, conn) -> int:
+        if not self.rows:
+            return 0
+        rows, self.rows = self.rows, []
+        with conn.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO run_items (run_id, kind, page_title, lang, status, message)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                """,
+                rows,
+            )
+        return len(rows)
+
+
 def last_run_id(conn) -> int | None:
     with conn.cursor() as cur:
         cur.execute("SELECT id FROM translation_runs ORDER BY id DESC LIMIT 1")
@@ -201,7 +240,15 @@ def fetch_items_by_status(conn, run_id: int) -> dict[str, list[dict[str, str | N
     return items
 
 
-def fetch_translate_ok_pairs(conn, run_id: int) -> list[tuple[str, str]]:
+def fetch_translate_ok_pairs(
+    conn,
+    run_id: int,
+    after: tuple[str, str] | None = None,
+    limit: int = 1000,
+) -> list[tuple[str, str]]:
+    # Keyset pages: callers read one page per short connection and release it
+    # before the slow per-pair work, continuing after the last pair seen.
+    after_title, after_lang = after if after is not None else (None, None)
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -209,9 +256,11 @@ def fetch_translate_ok_pairs(conn, run_id: int) -> list[tuple[str, str]]:
             FROM run_items
             WHERE run_id = %s AND kind = 'translate' AND status = 'ok'
               AND page_title IS NOT NULL AND lang IS NOT NULL
+              AND (%s::text IS NULL OR (page_title, lang) > (%s::text, %s::text))
             ORDER BY page_title, lang
+            LIMIT %s
             """,
-            (run_id,),
+            (run_id, after_title, after_title, after_lang, limit),
         )
         rows = cur.fetchall()
     return [(str(r[0]), str(r[1])) for r in rows]
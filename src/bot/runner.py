@@ -2,29 +2,36 @@ from __future__ import annotations
 
 import argparse
 import logging
-import hashlib
+import heapq
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 
 from .config import load_config
 from .logging import configure_logging, attach_file_logging
-from .mediawiki import MediaWikiClient
+from .mediawiki import MediaWikiClient, build_session
 from .db import get_conn
 from .jobs import (
     next_jobs,
+    max_job_id,
     mark_job_done,
     mark_job_error,
     count_jobs,
     delete_jobs_not_in_langs,
     delete_queued_jobs,
+    requeue_running_jobs,
 )
 from .ingest import ingest_all, ingest_title
-from .scheduler import run_poll_loop, poll_recent_changes
+from .scheduler import iter_recent_changes, run_poll_loop, poll_recent_changes
 from .sync_translation_status import main as sync_translation_status_main
-from .state import get_ingest_cursor, set_ingest_cursor
-from .translate_page import main as translate_page_main
-from .tracker import upsert_page
-from .segmenter import split_translate_units
+from .state import get_ingest_cursor, get_ingest_cursors, set_ingest_cursor, set_ingest_cursors
+from .translate_page import _checksum, build_args as translate_page_args, run as translate_page_run
+from .tracker import upsert_pages
+from .segmenter import SEGMENT_RE, split_translate_units
 from .run_report import (
+    LogBuffer,
     start_run,
     finish_run,
     log_item,
@@ -36,14 +43,16 @@ from .run_report import (
 )
 
 
-def _engine_lang_for(lang: str) -> str:
-    if lang == "sr":
-        return "sr-Latn"
-    return lang
+RUN_ALL_WATERMARK = "run_all_watermark"
+QUEUE_BATCH_SIZE = 5
+PLAN_FETCH_WORKERS = 8
+POLL_PIPELINE_QUEUE_SIZE = 200
+POLL_PIPELINE_IDLE_SECONDS = 1.0
+APPROVE_PAIRS_BATCH = 1000
 
 
 def _recentchanges_cursor_name(cfg) -> str:
-    langs = ",".join(sorted(set(cfg.target_langs)))
+    langs = ",".join(cfg.target_langs_sorted)
     return f"recentchanges:{langs}"
 
 
@@ -51,6 +60,28 @@ def _recentchanges_cursor_name_for_lang(lang: str) -> str:
     return f"recentchanges:{lang}"
 
 
+def _change_order(change) -> tuple[str, str]:
+    return change.timestamp, change.title
+
+
+def _latest_change_per_title(changes) -> list:
+    # Input is oldest-first; re-inserting a title moves it to the position of
+    # its newest change, so the result stays in timestamp order.
+    latest: dict[str, object] = {}
+    for change in changes:
+        latest.pop(change.title, None)
+        latest[change.title] = change
+    return list(latest.values())
+
+
+def _poll_cursor_names(cfg) -> list[str]:
+    # Single-language mode keeps the combined cursor name.
+    langs = cfg.target_langs_sorted
+    if len(langs) <= 1:
+        return [_recentchanges_cursor_name(cfg)]
+    return [_recentchanges_cursor_name_for_lang(lang) for lang in langs]
+
+
 def _collect_poll_changes(
     cfg,
     client,
@@ -58,33 +89,45 @@ def _collect_poll_changes(
     limit: int | None,
 ) -> tuple[list, dict[str, str | None]]:
     # Single-language mode keeps existing cursor behavior.
-    langs = sorted(set(cfg.target_langs))
+    langs = cfg.target_langs_sorted
     if len(langs) <= 1:
         cursor_name = _recentchanges_cursor_name(cfg)
         since = cursors.get(cursor_name)
         changes, new_since = poll_recent_changes(client, since, limit=limit)
-        return changes, {cursor_name: new_since}
+        return _latest_change_per_title(changes), {cursor_name: new_since}
 
     # Multi-language mode: union recentchanges from each language cursor so
-    # "all languages" behaves as sum of individual language windows.
-    merged: dict[str, object] = {}
+    # "all languages" behaves as sum of individual language windows. The
+    # per-language windows are fetched concurrently over the shared session.
+    cursor_names = [_recentchanges_cursor_name_for_lang(lang) for lang in langs]
+    with ThreadPoolExecutor(max_workers=len(cursor_names)) as executor:
+        futures = [
+            executor.submit(poll_recent_changes, client, cursors.get(name), limit=limit)
+            for name in cursor_names
+        ]
+        results = [future.result() for future in futures]
     new_since_by_cursor: dict[str, str | None] = {}
-    for lang in langs:
-        cursor_name = _recentchanges_cursor_name_for_lang(lang)
-        since = cursors.get(cursor_name)
-        changes, new_since = poll_recent_changes(client, since, limit=limit)
+    for cursor_name, (_changes, new_since) in zip(cursor_names, results):
         new_since_by_cursor[cursor_name] = new_since
-        for change in changes:
-            current = merged.get(change.title)
-            if current is None or getattr(current, "timestamp", "") < change.timestamp:
-                merged[change.title] = change
-    out = list(merged.values())
-    out.sort(key=lambda c: (getattr(c, "timestamp", ""), getattr(c, "title", "")))
-    return out, new_since_by_cursor
+    # Windows arrive oldest-first (rcdir=newer); ties on timestamp are broken
+    # by title so the merged order does not depend on cursor order. The
+    # per-window sort only reorders equal-timestamp runs.
+    merged = heapq.merge(
+        *(sorted(changes, key=_change_order) for changes, _ in results), key=_change_order
+    )
+    return _latest_change_per_title(merged), new_since_by_cursor
+
 
+def _load_segment_checksums(cfg, norm_title: str) -> dict[str, str]:
+    if not cfg.pg_dsn:
+        return {}
+    try:
+        from .db import fetch_segment_checksums
 
-def _checksum(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with get_conn(cfg.pg_dsn) as conn:
+            return fetch_segment_checksums(conn, norm_title)
+    except Exception:
+        return {}
 
 
 def _plan_page_segment_delta(cfg, client: MediaWikiClient, title: str) -> tuple[int, int] | None:
@@ -93,53 +136,71 @@ def _plan_page_segment_delta(cfg, client: MediaWikiClient, title: str) -> tuple[
     except Exception:
         return None
 
+    if not cfg.pg_dsn:
+        # Nothing stored to compare against: every unit is changed, so count
+        # markers instead of fetching unit pages or segmenting the text.
+        total = len(set(SEGMENT_RE.findall(source_wikitext)))
+        return (total, total)
+
+    existing_checksums = _load_segment_checksums(cfg, norm_title)
     segments: list[tuple[str, str]] = []
-    unit_keys = client.list_translation_unit_keys(norm_title, cfg.source_lang)
+    unit_keys = sorted(set(client.list_translation_unit_keys(norm_title, cfg.source_lang)), key=int)
     if unit_keys:
-        for key in sorted(set(unit_keys), key=lambda k: int(k)):
-            unit_title = f"Translations:{norm_title}/{key}/{cfg.source_lang}"
-            try:
-                unit_text, _, _ = client.get_page_wikitext(unit_title)
-                segments.append((key, unit_text))
-            except Exception:
-                # If any unit fetch fails, fall back to parser-based segmentation.
-                segments = []
-                break
+        # Every unit counts as changed unless the stored checksums cover
+        # exactly these keys, so only fetch unit texts when they can matter.
+        if set(existing_checksums.keys()) != set(unit_keys):
+            return (len(unit_keys), len(unit_keys))
+        unit_titles = [f"Translations:{norm_title}/{key}/{cfg.source_lang}" for key in unit_keys]
+        try:
+            with ThreadPoolExecutor(max_workers=PLAN_FETCH_WORKERS) as executor:
+                unit_texts = [text for text, _, _ in executor.map(client.get_page_wikitext, unit_titles)]
+            segments = list(zip(unit_keys, unit_texts))
+        except Exception:
+            # If any unit fetch fails, fall back to parser-based segmentation.
+            segments = []
 
     if not segments:
         parsed = split_translate_units(source_wikitext)
         dedup: dict[str, str] = {}
         for seg in parsed:
             dedup[seg.key] = seg.text
-        segments = sorted(dedup.items(), key=lambda kv: int(kv[0]))
+        segments = [(key, dedup[key]) for key in sorted(dedup, key=int)]
 
     total = len(segments)
-    if total == 0 or not cfg.pg_dsn:
-        return (total, total)
-
-    existing_checksums: dict[str, str] = {}
-    try:
-        from .db import fetch_segment_checksums
-
-        with get_conn(cfg.pg_dsn) as conn:
-            existing_checksums = fetch_segment_checksums(conn, norm_title)
-    except Exception:
-        existing_checksums = {}
-
-    if not existing_checksums:
+    if total == 0 or not existing_checksums:
         return (total, total)
 
     current_keys = {key for key, _ in segments}
     if set(existing_checksums.keys()) != current_keys:
         return (total, total)
 
-    changed = 0
-    for key, text in segments:
-        if existing_checksums.get(key) != _checksum(text):
-            changed += 1
+    # Stored checksums are written by translate_page, so the delta must use the
+    # same SHA-256 hex digest rather than a faster but incompatible hash.
+    changed = sum(1 for key, text in segments if existing_checksums.get(key) != _checksum(text))
     return (changed, total)
 
 
+def _translate_job(
+    cfg,
+    client,
+    job,
+    max_keys: int | None = None,
+    no_cache: bool = False,
+    rebuild_only: bool = False,
+):
+    args = translate_page_args(
+        job.page_title,
+        lang=job.lang,
+        engine_lang=cfg.engine_langs[job.lang],
+        auto_approve=True,
+        sleep_ms=800,
+        max_keys=max_keys if max_keys is not None and max_keys > 0 else None,
+        no_cache=no_cache,
+        rebuild_only=rebuild_only,
+    )
+    return translate_page_run(args, cfg=cfg, client=client)
+
+
 def process_queue(
     cfg,
     client,
@@ -148,109 +209,274 @@ def process_queue(
     max_keys: int | None = None,
     no_cache: bool = False,
     rebuild_only: bool = False,
-) -> None:
+    after_job_id: int | None = None,
+) -> int:
+    # Claim a batch, then hold no connection while pages are translated. The
+    # outcomes are recorded together on one connection once the batch ends,
+    # also when it is cut short by an exception.
     with get_conn(cfg.pg_dsn) as conn:
-        jobs = next_jobs(conn, limit=5)
+        jobs = next_jobs(conn, limit=QUEUE_BATCH_SIZE, after_id=after_job_id)
+    logs = LogBuffer(run_id)
+    done_ids: list[int] = []
+    failed: list[tuple[int, str]] = []
+    page_revs: list[tuple[str, int]] = []
+    try:
         for job in jobs:
+            if job.type == "translate_page" and job.lang not in cfg.target_langs:
+                done_ids.append(job.id)
+                logs.add("translate", "skip", job.page_title, job.lang, "lang not in target_langs")
+                continue
+            result = None
+            error: str | None = None
             try:
                 if job.type == "translate_page":
-                    if job.lang not in cfg.target_langs:
-                        mark_job_done(conn, job.id)
-                        if run_id is not None:
-                            log_item(
-                                conn,
-                                run_id,
-                                "translate",
-                                "skip",
-                                job.page_title,
-                                job.lang,
-                                "lang not in target_langs",
-                            )
-                        continue
                     if progress is not None:
                         progress["done"] += 1
-                        total = progress["total"]
+                        total = progress["total"] or "?"
                         current = progress["done"]
                         print(f"{current}/{total} translate {job.page_title} ({job.lang})")
-                    import sys
-                    sys.argv = [
-                        "translate_page",
-                        "--title",
-                        job.page_title,
-                        "--lang",
-                        job.lang,
-                        "--engine-lang",
-                        _engine_lang_for(job.lang),
-                        "--auto-approve",
-                        "--sleep-ms",
-                        "800",
-                    ]
-                    if max_keys is not None and max_keys > 0:
-                        sys.argv.extend(["--max-keys", str(max_keys)])
-                    if no_cache:
-                        sys.argv.append("--no-cache")
-                    if rebuild_only:
-                        sys.argv.append("--rebuild-only")
-                    result = translate_page_main()
-                    result_status = None
-                    if isinstance(result, dict):
-                        result_status = str(result.get("status", "")).strip().lower()
-                    if isinstance(result, dict):
-                        page_title = str(result.get("title") or "").strip()
-                        source_rev = str(result.get("source_rev") or "").strip()
-                        if page_title and source_rev.isdigit() and result_status not in ("", "error"):
-                            upsert_page(conn, page_title, cfg.source_lang, int(source_rev))
-                    if run_id is not None:
-                        status = "ok"
-                        message = None
-                        if isinstance(result, dict):
-                            if result_status and result_status.startswith("locked_"):
-                                status = "skip"
-                                message = result_status
-                            elif result_status == "outdated":
-                                status = "warning"
-                                message = "status changed to outdated"
-                        log_item(conn, run_id, "translate", status, job.page_title, job.lang, message)
-                mark_job_done(conn, job.id)
+                    result = _translate_job(
+                        cfg,
+                        client,
+                        job,
+                        max_keys=max_keys,
+                        no_cache=no_cache,
+                        rebuild_only=rebuild_only,
+                    )
             except SystemExit as exc:
-                message = str(exc) or "system exit"
-                mark_job_error(conn, job.id, message)
-                if run_id is not None:
-                    log_item(conn, run_id, "translate", "error", job.page_title, job.lang, message)
+                error = str(exc) or "system exit"
             except Exception as exc:
-                mark_job_error(conn, job.id, str(exc))
-                if run_id is not None:
-                    log_item(conn, run_id, "translate", "error", job.page_title, job.lang, str(exc))
+                error = str(exc)
+            if error is not None:
+                failed.append((job.id, error))
+                logs.add("translate", "error", job.page_title, job.lang, error)
+                continue
+            if job.type == "translate_page":
+                result_status = None
+                if isinstance(result, dict):
+                    result_status = str(result.get("status", "")).strip().lower()
+                if isinstance(result, dict):
+                    page_title = str(result.get("title") or "").strip()
+                    source_rev = str(result.get("source_rev") or "").strip()
+                    if page_title and source_rev.isdigit() and result_status not in ("", "error"):
+                        page_revs.append((page_title, int(source_rev)))
+                status = "ok"
+                message = None
+                if isinstance(result, dict):
+                    if result_status and result_status.startswith("locked_"):
+                        status = "skip"
+                        message = result_status
+                    elif result_status == "outdated":
+                        status = "warning"
+                        message = "status changed to outdated"
+                logs.add("translate", status, job.page_title, job.lang, message)
+            done_ids.append(job.id)
+    finally:
+        if jobs:
+            with get_conn(cfg.pg_dsn) as conn:
+                upsert_pages(conn, ((title, cfg.source_lang, rev) for title, rev in page_revs))
+                for job_id in done_ids:
+                    mark_job_done(conn, job_id)
+                for job_id, error in failed:
+                    mark_job_error(conn, job_id, error)
+                logs.flush(conn)
+    return len(jobs)
 
 
-def retry_approve_from_run(cfg, client, source_run_id: int, log_run_id: int) -> None:
+def _drain_queue(
+    cfg,
+    client,
+    run_id: int | None,
+    progress: dict[str, int] | None,
+    max_keys: int | None = None,
+    no_cache: bool = False,
+    rebuild_only: bool = False,
+) -> None:
+    # An empty claim ends the drain; no separate peek query is needed.
+    while process_queue(
+        cfg,
+        client,
+        run_id=run_id,
+        progress=progress,
+        max_keys=max_keys,
+        no_cache=no_cache,
+        rebuild_only=rebuild_only,
+    ):
+        pass
+
+
+_POLL_WINDOW_DONE = object()
+
+
+def _poll_once_pipeline(
+    cfg,
+    client,
+    run_id: int,
+    cursors: dict[str, str | None],
+    args,
+) -> dict[str, str | None]:
+    # Fetch, ingest and translate overlap: one producer thread per cursor feeds
+    # a bounded queue, this thread ingests titles as they arrive and commits
+    # each one, and a drain thread translates jobs as soon as they are queued.
+    changes: queue.Queue = queue.Queue(maxsize=POLL_PIPELINE_QUEUE_SIZE)
+    new_since_by_cursor: dict[str, str | None] = {}
+    errors: list[BaseException] = []
+    stop = threading.Event()
+    ingest_done = threading.Event()
+    # The queue size is unknown until ingest ends; 0 prints as "?".
+    progress = {"done": 0, "total": 0}
+
+    def _fail(exc: BaseException) -> None:
+        errors.append(exc)
+        stop.set()
+
+    def _put(item: object) -> None:
+        while not stop.is_set():
+            try:
+                changes.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def _produce(cursor_name: str) -> None:
+        try:
+            # Stream each recentchanges page into the queue as it arrives.
+            new_since = cursors.get(cursor_name)
+            window = iter_recent_changes(client, new_since)
+            if args.poll_limit is not None and args.poll_limit > 0:
+                window = islice(window, args.poll_limit)
+            for change in window:
+                if stop.is_set():
+                    return
+                _put(change)
+                new_since = change.timestamp
+            new_since_by_cursor[cursor_name] = new_since
+        except BaseException as exc:
+            _fail(exc)
+        finally:
+            _put(_POLL_WINDOW_DONE)
+
+    # Jobs queued before this poll wait until ingest is done: enqueue_job only
+    # dedupes against 'queued' rows, so claiming one of them early would let
+    # ingest queue the same page again.
     with get_conn(cfg.pg_dsn) as conn:
-        pairs = fetch_translate_ok_pairs(conn, source_run_id)
-    if not pairs:
-        return
-    for page_title, lang in pairs:
-        if lang not in cfg.target_langs:
-            continue
-        import sys
-        sys.argv = [
-            "translate_page",
-            "--title",
-            page_title,
-            "--lang",
-            lang,
-            "--approve-only",
-            "--retry-approve",
-        ]
-        result = translate_page_main()
-        status = "ok"
-        message = None
-        if isinstance(result, dict):
-            approve_status = result.get("approve_status")
-            if approve_status == "no_revisions":
-                status = "warning"
-                message = "no revisions for assembled page"
+        preexisting_job_id = max_job_id(conn)
+
+    def _drain() -> None:
+        try:
+            while not stop.is_set():
+                finished = ingest_done.is_set()
+                if process_queue(
+                    cfg,
+                    client,
+                    run_id=run_id,
+                    progress=progress,
+                    max_keys=args.max_keys,
+                    no_cache=args.no_cache,
+                    rebuild_only=args.rebuild_only,
+                    after_job_id=None if finished else preexisting_job_id,
+                ):
+                    continue
+                if finished:
+                    break
+                ingest_done.wait(POLL_PIPELINE_IDLE_SECONDS)
+        except BaseException as exc:
+            _fail(exc)
+
+    producers = [
+        threading.Thread(target=_produce, args=(name,), daemon=True) for name in cursors
+    ]
+    drainer = threading.Thread(target=_drain, daemon=True)
+    for thread in producers:
+        thread.start()
+    drainer.start()
+
+    pending = len(producers)
+    seen_titles: set[str] = set()
+    try:
+        with get_conn(cfg.pg_dsn) as conn:
+            while pending and not stop.is_set():
+                try:
+                    change = changes.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if change is _POLL_WINDOW_DONE:
+                    pending -= 1
+                    continue
+                # Windows of different languages overlap; ingest reads the
+                # current revision, so the first sighting of a title is enough.
+                if change.title in seen_titles:
+                    continue
+                seen_titles.add(change.title)
+                try:
+                    ingest_title(
+                        cfg,
+                        client,
+                        conn,
+                        change.title,
+                        record=lambda *a, **k: None,
+                        force=args.force_retranslate,
+                        enqueue_missing_when_unchanged=args.include_missing,
+                    )
+                    log_item(conn, run_id, "ingest", "ok", change.title, None, None)
+                except Exception as exc:
+                    log_item(conn, run_id, "ingest", "error", change.title, None, str(exc))
+                # Make the new jobs visible to the drain thread right away.
+                conn.commit()
+            queued = count_jobs(conn, status="queued", job_type="translate_page")
+            progress["total"] = progress["done"] + queued
+    except BaseException as exc:
+        _fail(exc)
+    finally:
+        ingest_done.set()
+        for thread in producers:
+            thread.join()
+        drainer.join()
+    if errors:
+        raise errors[0]
+    return new_since_by_cursor
+
+
+def _requeue_interrupted_jobs(cfg) -> None:
+    # Only the queue-draining paths call this: a read-only invocation (report,
+    # retry-approve) must not reset jobs another runner is still working on.
+    with get_conn(cfg.pg_dsn) as conn:
+        requeued = requeue_running_jobs(conn)
+    if requeued:
+        logging.getLogger("runner").warning(
+            "requeued jobs left running by an interrupted run: count=%s",
+            requeued,
+        )
+
+
+def retry_approve_from_run(cfg, client, source_run_id: int, log_run_id: int) -> None:
+    # Pairs are read a page at a time on a short connection, so no pooled
+    # connection is held across the approve calls; each log row commits alone.
+    after = None
+    while True:
         with get_conn(cfg.pg_dsn) as conn:
-            log_item(conn, log_run_id, "approve", status, page_title, lang, message)
+            pairs = fetch_translate_ok_pairs(
+                conn, source_run_id, after=after, limit=APPROVE_PAIRS_BATCH
+            )
+        if not pairs:
+            return
+        for page_title, lang in pairs:
+            if lang not in cfg.target_langs:
+                continue
+            args = translate_page_args(page_title, lang=lang, approve_only=True, retry_approve=True)
+            result = translate_page_run(args, cfg=cfg, client=client)
+            status = "ok"
+            message = None
+            if isinstance(result, dict):
+                approve_status = result.get("approve_status")
+                if approve_status == "no_revisions":
+                    status = "warning"
+                    message = "no revisions for assembled page"
+            with get_conn(cfg.pg_dsn) as conn:
+                log_item(conn, log_run_id, "approve", status, page_title, lang, message)
+        if len(pairs) < APPROVE_PAIRS_BATCH:
+            return
+        after = pairs[-1]
 
 
 def main() -> None:
@@ -324,7 +550,7 @@ def main() -> None:
         log_item(conn, run_id, "run", "info", None, None, f"raw_log={log_path}")
         return log_path
 
-    session = __import__("requests").Session()
+    session = build_session(cfg.mw_user_agent)
     client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
     client.login(cfg.mw_username, cfg.mw_password)
 
@@ -342,6 +568,7 @@ def main() -> None:
                 sleep_ms=args.ingest_sleep_ms,
                 limit=args.ingest_limit,
                 force=args.force_retranslate,
+                prefetch=True,
             )
         return
 
@@ -398,11 +625,37 @@ def main() -> None:
         return
 
     if args.run_all:
+        _requeue_interrupted_jobs(cfg)
         run_id: int | None = None
         try:
             with get_conn(cfg.pg_dsn) as conn:
                 run_id = start_run(conn, "run-all", cfg)
                 _setup_run_log(conn, run_id)
+                watermark = get_ingest_cursor(conn, RUN_ALL_WATERMARK)
+                latest_change = client.recentchanges_latest_timestamp()
+                # Nothing edited since the last complete run-all and nothing left
+                # in the queue: skip both the full scan and the drain.
+                if (
+                    latest_change
+                    and latest_change == watermark
+                    and not args.force_retranslate
+                    and count_jobs(conn, status="queued", job_type="translate_page") == 0
+                ):
+                    log_item(
+                        conn,
+                        run_id,
+                        "run",
+                        "info",
+                        None,
+                        None,
+                        f"no recentchanges since {watermark}; skipped ingest",
+                    )
+                    finish_run(conn, run_id, "done_no_op")
+                    report_path = write_report_file(conn, run_id)
+                    print(str(report_path))
+                    return
+
+                ingest_logs = LogBuffer(run_id)
 
                 def _record(
                     kind: str,
@@ -411,29 +664,43 @@ def main() -> None:
                     lang: str | None,
                     message: str,
                 ) -> None:
-                    log_item(conn, run_id, kind, status, page_title, lang, message)
+                    ingest_logs.add(kind, status, page_title, lang, message)
+                    if ingest_logs.full:
+                        ingest_logs.flush(conn)
 
-                ingest_all(
-                    cfg,
-                    client,
-                    conn,
-                    sleep_ms=args.ingest_sleep_ms,
-                    limit=args.ingest_limit,
-                    record=_record,
-                    force=args.force_retranslate,
-                )
+                try:
+                    ingest_all(
+                        cfg,
+                        client,
+                        conn,
+                        sleep_ms=args.ingest_sleep_ms,
+                        limit=args.ingest_limit,
+                        record=_record,
+                        force=args.force_retranslate,
+                        prefetch=True,
+                    )
+                finally:
+                    ingest_logs.flush(conn)
                 delete_jobs_not_in_langs(conn, cfg.target_langs, job_type="translate_page")
             with get_conn(cfg.pg_dsn) as conn:
                 total_jobs = count_jobs(conn, status="queued", job_type="translate_page")
             progress = {"done": 0, "total": max(total_jobs, 1)}
-            while True:
-                with get_conn(cfg.pg_dsn) as conn:
-                    if not next_jobs(conn, limit=1):
-                        break
-                process_queue(cfg, client, run_id=run_id, progress=progress, max_keys=args.max_keys, no_cache=args.no_cache, rebuild_only=args.rebuild_only)
+            _drain_queue(
+                cfg,
+                client,
+                run_id,
+                progress,
+                max_keys=args.max_keys,
+                no_cache=args.no_cache,
+                rebuild_only=args.rebuild_only,
+            )
             if args.retry_approve:
                 retry_approve_from_run(cfg, client, run_id, run_id)
             with get_conn(cfg.pg_dsn) as conn:
+                # A limited ingest only saw part of the wiki, so it must not
+                # mark the current recentchanges state as fully processed.
+                if latest_change and not args.ingest_limit:
+                    set_ingest_cursor(conn, RUN_ALL_WATERMARK, latest_change)
                 finish_run(conn, run_id, "done")
                 report_path = write_report_file(conn, run_id)
             print(str(report_path))
@@ -448,48 +715,30 @@ def main() -> None:
 
     if args.only_title:
         # run translation pipeline for a single page
-        import sys
         for lang in cfg.target_langs:
-            sys.argv = [
-                "translate_page",
-                "--title",
+            page_args = translate_page_args(
                 args.only_title,
-                "--lang",
-                lang,
-                "--engine-lang",
-                _engine_lang_for(lang),
-                "--auto-approve",
-                "--sleep-ms",
-                "800",
-            ]
-            if args.max_keys is not None and args.max_keys > 0:
-                sys.argv.extend(["--max-keys", str(args.max_keys)])
-            if args.no_cache:
-                sys.argv.append("--no-cache")
-            if args.rebuild_only:
-                sys.argv.append("--rebuild-only")
-            translate_page_main()
+                lang=lang,
+                engine_lang=cfg.engine_langs[lang],
+                auto_approve=True,
+                sleep_ms=800,
+                max_keys=args.max_keys if args.max_keys is not None and args.max_keys > 0 else None,
+                no_cache=args.no_cache,
+                rebuild_only=args.rebuild_only,
+            )
+            translate_page_run(page_args, cfg=cfg, client=client)
         return
 
     if args.poll_once:
-        cursor_name = _recentchanges_cursor_name(cfg)
         if args.dry_run:
             existing_queued = 0
-            cursors: dict[str, str | None] = {}
             with get_conn(cfg.pg_dsn) as conn:
                 existing_queued = count_jobs(conn, status="queued", job_type="translate_page")
-                langs = sorted(set(cfg.target_langs))
-                if len(langs) <= 1:
-                    cursors[cursor_name] = get_ingest_cursor(conn, cursor_name)
-                else:
-                    for lang in langs:
-                        lang_cursor_name = _recentchanges_cursor_name_for_lang(lang)
-                        cursors[lang_cursor_name] = get_ingest_cursor(conn, lang_cursor_name)
+                cursors = get_ingest_cursors(conn, _poll_cursor_names(cfg))
             changes, _new_since_by_cursor = _collect_poll_changes(
                 cfg, client, cursors, limit=args.poll_limit
             )
             plan_pages: set[str] = set()
-            seen_titles: set[str] = set()
             with get_conn(cfg.pg_dsn) as conn:
                 def _record(
                     kind: str,
@@ -502,9 +751,6 @@ def main() -> None:
                         plan_pages.add(page_title)
 
                 for change in changes:
-                    if change.title in seen_titles:
-                        continue
-                    seen_titles.add(change.title)
                     ingest_title(
                         cfg,
                         client,
@@ -532,62 +778,17 @@ def main() -> None:
                 print(f"{title} ({changed}/{total}, reason={reason})")
             return
 
+        _requeue_interrupted_jobs(cfg)
         run_id = None
         try:
-            cursors: dict[str, str | None] = {}
             with get_conn(cfg.pg_dsn) as conn:
                 run_id = start_run(conn, "poll-once", cfg)
                 _setup_run_log(conn, run_id)
-                langs = sorted(set(cfg.target_langs))
-                if len(langs) <= 1:
-                    cursors[cursor_name] = get_ingest_cursor(conn, cursor_name)
-                else:
-                    for lang in langs:
-                        lang_cursor_name = _recentchanges_cursor_name_for_lang(lang)
-                        cursors[lang_cursor_name] = get_ingest_cursor(conn, lang_cursor_name)
-            changes, new_since_by_cursor = _collect_poll_changes(
-                cfg, client, cursors, limit=args.poll_limit
-            )
-            if changes:
-                seen_titles: set[str] = set()
-                with get_conn(cfg.pg_dsn) as conn:
-                    for change in changes:
-                        if change.title in seen_titles:
-                            continue
-                        seen_titles.add(change.title)
-                        try:
-                            ingest_title(
-                                cfg,
-                                client,
-                                conn,
-                                change.title,
-                                record=lambda *a, **k: None,
-                                force=args.force_retranslate,
-                                enqueue_missing_when_unchanged=args.include_missing,
-                            )
-                            log_item(conn, run_id, "ingest", "ok", change.title, None, None)
-                        except Exception as exc:
-                            log_item(conn, run_id, "ingest", "error", change.title, None, str(exc))
-            with get_conn(cfg.pg_dsn) as conn:
-                total_jobs = count_jobs(conn, status="queued", job_type="translate_page")
-            progress = {"done": 0, "total": max(total_jobs, 1)}
-            while True:
-                with get_conn(cfg.pg_dsn) as conn:
-                    if not next_jobs(conn, limit=1):
-                        break
-                process_queue(
-                    cfg,
-                    client,
-                    run_id=run_id,
-                    progress=progress,
-                    max_keys=args.max_keys,
-                    no_cache=args.no_cache,
-                    rebuild_only=args.rebuild_only,
-                )
+                cursors = get_ingest_cursors(conn, _poll_cursor_names(cfg))
+            new_since_by_cursor = _poll_once_pipeline(cfg, client, run_id, cursors, args)
             # Advance poll cursor only after successful completion.
             with get_conn(cfg.pg_dsn) as conn:
-                for c_name, c_value in new_since_by_cursor.items():
-                    set_ingest_cursor(conn, c_name, c_value)
+                set_ingest_cursors(conn, new_since_by_cursor)
                 finish_run(conn, run_id, "done")
                 report_path = write_report_file(conn, run_id)
             print(str(report_path))
@@ -601,9 +802,11 @@ def main() -> None:
         return
 
     if args.poll:
+        _requeue_interrupted_jobs(cfg)
         run_poll_loop(cfg, client)
         return
 
+    _requeue_interrupted_jobs(cfg)
     process_queue(cfg, client, max_keys=args.max_keys, no_cache=args.no_cache, rebuild_only=args.rebuild_only)
 
 
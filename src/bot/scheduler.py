@@ -3,32 +3,29 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass
+from itertools import islice
+from typing import Iterator
 
 from .config import Config
 from .mediawiki import MediaWikiClient
 from .db import get_conn
-from .ingest import ingest_title
+from .ingest import ingest_titles_bulk
 
 log = logging.getLogger("bot.scheduler")
 
 
-@dataclass
+@dataclass(slots=True)
 class Change:
     title: str
     rev_id: int
     timestamp: str
 
 
-def poll_recent_changes(
-    client: MediaWikiClient,
-    since: str | None,
-    limit: int | None = None,
-) -> tuple[list[Change], str | None]:
-    changes: list[Change] = []
+def iter_recent_changes(client: MediaWikiClient, since: str | None) -> Iterator[Change]:
+    # Follows rccontinue lazily: the next page is only requested once the
+    # caller has consumed the current one.
     rccontinue: str | None = None
     while True:
-        if limit is not None and limit > 0 and len(changes) >= limit:
-            break
         params = {
             "action": "query",
             "list": "recentchanges",
@@ -43,23 +40,26 @@ def poll_recent_changes(
             **({"rccontinue": rccontinue, "continue": "-||"} if rccontinue else {}),
         }
         data = client._request("GET", params)
-        for rc in data.get("query", {}).get("recentchanges", []):
-            changes.append(Change(title=rc["title"], rev_id=int(rc["revid"]), timestamp=rc["timestamp"]))
-            if limit is not None and limit > 0 and len(changes) >= limit:
-                break
-        if limit is not None and limit > 0 and len(changes) >= limit:
-            break
+        for rc in data.get("query", {}).get("recentchanges", ()):
+            yield Change(rc["title"], int(rc["revid"]), rc["timestamp"])
         cont = data.get("continue", {})
         rccontinue = cont.get("rccontinue")
         if not rccontinue:
-            break
-    # use last timestamp as new cursor
-    new_since = changes[-1].timestamp if changes else since
-    return changes, new_since
+            return
 
 
-def enqueue_for_change(cfg: Config, client: MediaWikiClient, conn, title: str, rev_id: int) -> None:
-    ingest_title(cfg, client, conn, title)
+def poll_recent_changes(
+    client: MediaWikiClient,
+    since: str | None,
+    limit: int | None = None,
+) -> tuple[list[Change], str | None]:
+    changes = iter_recent_changes(client, since)
+    if limit is not None and limit > 0:
+        changes = islice(changes, limit)
+    out = list(changes)
+    # use last timestamp as new cursor
+    new_since = out[-1].timestamp if out else since
+    return out, new_since
 
 
 def run_poll_loop(cfg: Config, client: MediaWikiClient) -> None:
@@ -68,6 +68,5 @@ def run_poll_loop(cfg: Config, client: MediaWikiClient) -> None:
         changes, since = poll_recent_changes(client, since)
         if changes:
             with get_conn(cfg.pg_dsn) as conn:
-                for change in changes:
-                    enqueue_for_change(cfg, client, conn, change.title, change.rev_id)
+                ingest_titles_bulk(cfg, client, conn, [change.title for change in changes])
         time.sleep(cfg.poll_interval_seconds)
@@ -6,6 +6,9 @@ from dataclasses import dataclass
 
 SEGMENT_RE = re.compile(r"<!--T:(\d+)-->")
 TRANSLATE_TAG_RE = re.compile(r"</?translate>")
+# Unit markers and translate tags in one alternation, so a single scan both
+# splits units and drops the tags.
+UNIT_TOKEN_RE = re.compile(r"<!--T:(\d+)-->|</?translate>")
 
 
 @dataclass(frozen=True)
@@ -15,16 +18,27 @@ class Segment:
 
 
 def split_translate_units(wikitext: str) -> list[Segment]:
-    matches = list(SEGMENT_RE.finditer(wikitext))
     segments: list[Segment] = []
-    if not matches:
-        return segments
-
-    for idx, match in enumerate(matches):
-        start = match.end()
-        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(wikitext)
-        raw = wikitext[start:end]
-        cleaned = TRANSLATE_TAG_RE.sub("", raw).strip()
+    key: str | None = None
+    parts: list[str] = []
+    pos = 0
+
+    def _flush() -> None:
+        cleaned = "".join(parts).strip()
         if cleaned:
-            segments.append(Segment(key=match.group(1), text=cleaned))
+            segments.append(Segment(key=key, text=cleaned))
+
+    for match in UNIT_TOKEN_RE.finditer(wikitext):
+        if key is not None:
+            parts.append(wikitext[pos : match.start()])
+        pos = match.end()
+        marker = match.group(1)
+        if marker is not None:
+            if key is not None:
+                _flush()
+            key = marker
+            parts = []
+    if key is not None:
+        parts.append(wikitext[pos:])
+        _flush()
     return segments
@@ -12,6 +12,17 @@ def get_ingest_cursor(conn: psycopg.Connection, name: str = "main") -> str | Non
         return row[0]
 
 
+def get_ingest_cursors(conn: psycopg.Connection, names: list[str]) -> dict[str, str | None]:
+    # Names without a stored row map to None, like get_ingest_cursor.
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT name, apcontinue FROM ingest_state WHERE name = ANY(%s)",
+            (list(names),),
+        )
+        stored = {row[0]: row[1] for row in cur.fetchall()}
+    return {name: stored.get(name) for name in names}
+
+
 def set_ingest_cursor(
     conn: psycopg.Connection, name: str = "main", apcontinue: str | None = None
 ) -> None:
@@ -25,3 +36,43 @@ def set_ingest_cursor(
             """,
             (name, apcontinue),
         )
+
+
+def set_ingest_cursors(conn: psycopg.Connection, items: dict[str, str | None]) -> None:
+    if not items:
+        return
+    # psycopg 3 sends executemany batches in pipeline mode: one round trip.
+    with conn.cursor() as cur:
+        cur.executemany(
+            """
+            INSERT INTO ingest_state (name, apcontinue, updated_at)
+            VALUES (%s, %s, NOW())
+            ON CONFLICT (name)
+            DO UPDATE SET apcontinue = EXCLUDED.apcontinue, updated_at = NOW()
+            """,
+            list(items.items()),
+        )
+
+
+def get_status_sync_revs(conn: psycopg.Connection) -> dict[tuple[str, str], tuple[int, int]]:
+    # (title, lang) -> (source_rev, translated_rev) of the last completed reviewed sync.
+    with conn.cursor() as cur:
+        cur.execute("SELECT title, lang, source_rev, translated_rev FROM status_sync_state")
+        return {(row[0], row[1]): (row[2], row[3]) for row in cur.fetchall()}
+
+
+def set_status_sync_revs(conn: psycopg.Connection, rows: list[tuple[str, str, int, int]]) -> None:
+    if not rows:
+        return
+    with conn.cursor() as cur:
+        cur.executemany(
+            """
+            INSERT INTO status_sync_state (title, lang, source_rev, translated_rev, updated_at)
+            VALUES (%s, %s, %s, %s, NOW())
+            ON CONFLICT (title, lang)
+            DO UPDATE SET source_rev = EXCLUDED.source_rev,
+                          translated_rev = EXCLUDED.translated_rev,
+                          updated_at = NOW()
+            """,
+            rows,
+        )
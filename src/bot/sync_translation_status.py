@@ -2,20 +2,21 @@ from __future__ import annotations
 
 import argparse
 import logging
-
-import requests
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 
 from .config import load_config
+from .db import get_conn
 from .ingest import is_translation_subpage
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient
+from .mediawiki import MediaWikiClient, build_session
+from .state import get_status_sync_revs, set_status_sync_revs
 from .translate_page import (
-    _collapse_blank_lines,
-    _compact_leading_metadata_preamble,
-    _normalize_leading_directives,
-    _normalize_leading_div,
-    _normalize_leading_status_directives,
-    _remove_disclaimer_tables,
+    TRANSLATION_STATUS_TEMPLATE_RE,
+    _build_status_template,
+    _equal_ignoring_edge_ws,
+    _normalize_unit1,
     _translation_status_from_ai_info,
     _translation_status_from_props,
     _translation_status_from_unit1,
@@ -26,14 +27,137 @@ from .translate_page import (
 
 log = logging.getLogger("bot.sync_translation_status")
 
+SYNC_WORKERS = 8
+REVIEWED_STATUS_TEMPLATE = _build_status_template(status="reviewed")
+
+
+def _reviewed_template_in_place(text: str) -> bool:
+    # The reviewed template already leads the unit, is the only one and no
+    # disclaimer remains: the rewrite could only reflow layout, so skip it.
+    return (
+        text.startswith(REVIEWED_STATUS_TEMPLATE)
+        and "translation-disclaimer" not in text
+        and len(TRANSLATION_STATUS_TEMPLATE_RE.findall(text)) == 1
+    )
+
+
+def iter_source_revisions(client, title_batches: Iterable[list[str]], langs: tuple[str, ...]):
+    # Resolves source revisions, translated pages and their pageprops one
+    # batch of titles at a time; yields
+    # (source_rev, norm_title, {existing translated_title: (revid, pageprops)}).
+    for chunk in title_batches:
+        if not chunk:
+            continue
+        try:
+            source_revs = client.get_page_revision_ids(chunk)
+        except Exception as exc:
+            log.warning("revision lookup failed for %s titles: %s", len(chunk), exc)
+            continue
+        sources = [source_revs[title] for title in chunk if title in source_revs]
+        translated_titles = [f"{norm_title}/{lang}" for _, norm_title in sources for lang in langs]
+        try:
+            translated_revs = client.get_page_revision_ids(translated_titles)
+        except Exception as exc:
+            log.warning("revision lookup failed for %s titles: %s", len(translated_titles), exc)
+            translated_revs = {}
+        try:
+            props = client.get_page_props_bulk(list(translated_revs))
+        except Exception as exc:
+            log.warning("pageprops lookup failed for %s titles: %s", len(translated_revs), exc)
+            props = {}
+        for source_rev, norm_title in sources:
+            pages = {}
+            for lang in langs:
+                translated_title = f"{norm_title}/{lang}"
+                if translated_title in translated_revs:
+                    pages[translated_title] = (
+                        translated_revs[translated_title][0],
+                        props.get(translated_title, {}),
+                    )
+            yield source_rev, norm_title, pages
+
+
+def _sync_page(cfg, client, args, source_rev_s: str, norm_title: str, lang: str, props) -> Counter:
+    translated_title = f"{norm_title}/{lang}"
+    counts = Counter(scanned=1)
+    try:
+        ai_info = client.get_ai_translation_info(translated_title)
+    except Exception:
+        ai_info = {}
+    status_meta = _translation_status_from_ai_info(ai_info)
+    status_meta = {**_translation_status_from_props(props), **status_meta}
+    # Metadata without a status is a non-reviewed page; only untracked pages
+    # pay for the unit-key listing and unit1 read of the template fallback.
+    if not status_meta:
+        status_meta = _translation_status_from_unit1(
+            client, norm_title, lang, source_lang=cfg.source_lang
+        )
+    status = status_meta.get("dr_translation_status", "").strip().lower()
+    if status != "reviewed":
+        counts["skipped"] += 1
+        return counts
+
+    unit1 = _unit_title(norm_title, "1", lang)
+    try:
+        unit1_text, _, _ = client.get_page_wikitext(unit1)
+    except Exception as exc:
+        counts["errors"] += 1
+        log.warning("read failed %s: %s", unit1, exc)
+        return counts
+
+    if _reviewed_template_in_place(unit1_text):
+        updated = unit1_text
+    else:
+        updated = _upsert_status_template(
+            unit1_text,
+            status="reviewed",
+        )
+        updated = _normalize_unit1(updated)
+
+    if not _equal_ignoring_edge_ws(updated, unit1_text):
+        if args.dry_run:
+            log.info("DRY RUN edit %s", unit1)
+        else:
+            try:
+                client.edit(
+                    unit1,
+                    updated,
+                    "Bot: sync reviewed translation status metadata",
+                    bot=True,
+                )
+                counts["edited"] += 1
+                log.info("edited %s", unit1)
+            except Exception as exc:
+                counts["errors"] += 1
+                log.warning("edit failed %s: %s", unit1, exc)
+                return counts
+    else:
+        counts["skipped"] += 1
 
-def _normalize_unit1(text: str) -> str:
-    text = _remove_disclaimer_tables(text)
-    text = _normalize_leading_directives(text)
-    text = _normalize_leading_status_directives(text)
-    text = _normalize_leading_div(text)
-    text = _compact_leading_metadata_preamble(text)
-    return _collapse_blank_lines(text)
+    if not args.dry_run:
+        try:
+            client.set_ai_translation_status(
+                title=translated_title,
+                status="reviewed",
+                source_rev=source_rev_s,
+                source_title=norm_title,
+                source_lang=cfg.source_lang,
+            )
+        except Exception as exc:
+            counts["errors"] += 1
+            log.warning("ai props write failed %s: %s", translated_title, exc)
+
+    if args.approve and not args.dry_run:
+        try:
+            translated_rev, _ = client.get_page_revision_id(translated_title)
+            client.approve_revision(translated_rev)
+            counts["approved"] += 1
+        except Exception as exc:
+            counts["errors"] += 1
+            log.warning("approve failed %s: %s", translated_title, exc)
+    if not counts["errors"]:
+        counts["synced"] += 1
+    return counts
 
 
 def main() -> None:
@@ -42,6 +166,11 @@ def main() -> None:
     parser.add_argument("--langs", default=None, help="comma-separated langs; defaults to BOT_TARGET_LANGS")
     parser.add_argument("--approve", action="store_true", help="approve translated page after metadata sync")
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="recheck pages whose source and translated revisions are unchanged since the last sync",
+    )
     args = parser.parse_args()
 
     configure_logging()
@@ -52,115 +181,66 @@ def main() -> None:
     if not langs:
         raise SystemExit("no languages configured")
 
-    client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, requests.Session())
+    client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, build_session(cfg.mw_user_agent))
     client.login(cfg.mw_username, cfg.mw_password)
 
-    titles = [args.only_title] if args.only_title else client.iter_main_namespace_titles()
-
-    scanned = 0
-    edited = 0
-    skipped = 0
-    missing = 0
-    approved = 0
-    errors = 0
-
-    for src_title in titles:
-        if is_translation_subpage(src_title, langs):
-            continue
-        try:
-            source_rev, norm_title = client.get_page_revision_id(src_title)
-        except Exception:
-            continue
-        source_rev_s = str(source_rev)
-
-        for lang in langs:
-            translated_title = f"{norm_title}/{lang}"
-            try:
-                translated_rev, _ = client.get_page_revision_id(translated_title)
-            except Exception:
-                missing += 1
-                continue
-
-            scanned += 1
-            ai_info = {}
-            try:
-                ai_info = client.get_ai_translation_info(translated_title)
-            except Exception:
-                ai_info = {}
-            props, _, _ = client.get_page_props(translated_title)
-            status_meta = _translation_status_from_ai_info(ai_info)
-            status_meta = {**_translation_status_from_props(props), **status_meta}
-            if "dr_translation_status" not in status_meta:
-                status_meta = {
-                    **status_meta,
-                    **_translation_status_from_unit1(
-                        client, norm_title, lang, source_lang=cfg.source_lang
-                    ),
-                }
-            status = status_meta.get("dr_translation_status", "").strip().lower()
-            if status != "reviewed":
-                skipped += 1
-                continue
-
-            unit1 = _unit_title(norm_title, "1", lang)
-            try:
-                unit1_text, _, _ = client.get_page_wikitext(unit1)
-            except Exception as exc:
-                errors += 1
-                log.warning("read failed %s: %s", unit1, exc)
-                continue
+    if args.only_title:
+        title_batches = [[args.only_title]]
+    else:
+        title_batches = client.iter_main_namespace_title_batches()
+    title_batches = (
+        [title for title in batch if not is_translation_subpage(title, langs)]
+        for batch in title_batches
+    )
 
-            updated = _upsert_status_template(
-                unit1_text,
-                status="reviewed",
-            )
-            updated = _normalize_unit1(updated)
-
-            if updated.strip() != unit1_text.strip():
-                if args.dry_run:
-                    log.info("DRY RUN edit %s", unit1)
-                else:
-                    try:
-                        client.edit(
-                            unit1,
-                            updated,
-                            "Bot: sync reviewed translation status metadata",
-                            bot=True,
-                        )
-                        edited += 1
-                        log.info("edited %s", unit1)
-                    except Exception as exc:
-                        errors += 1
-                        log.warning("edit failed %s: %s", unit1, exc)
-                        continue
-            else:
-                skipped += 1
-
-            if not args.dry_run:
-                try:
-                    client.set_ai_translation_status(
-                        title=translated_title,
-                        status="reviewed",
-                        source_rev=source_rev_s,
-                        source_title=norm_title,
-                        source_lang=cfg.source_lang,
-                    )
-                except Exception as exc:
-                    errors += 1
-                    log.warning("ai props write failed %s: %s", translated_title, exc)
-
-            if args.approve and not args.dry_run:
-                try:
-                    translated_rev, _ = client.get_page_revision_id(translated_title)
-                    client.approve_revision(translated_rev)
-                    approved += 1
-                except Exception as exc:
-                    errors += 1
-                    log.warning("approve failed %s: %s", translated_title, exc)
+    # Reviewed pages whose revisions have not moved since their last sync
+    # are skipped without any further API calls.
+    use_cache = bool(cfg.pg_dsn) and not args.no_cache
+    seen: dict[tuple[str, str], tuple[int, int]] = {}
+    if use_cache:
+        with get_conn(cfg.pg_dsn) as conn:
+            seen = get_status_sync_revs(conn)
+
+    counts = Counter()
+    synced: list[tuple[str, str, int, int]] = []
+
+    def _pages():
+        for source_rev, norm_title, translated_pages in iter_source_revisions(
+            client, title_batches, langs
+        ):
+            for lang in langs:
+                translated_title = f"{norm_title}/{lang}"
+                if translated_title not in translated_pages:
+                    counts["missing"] += 1
+                    continue
+                translated_rev, props = translated_pages[translated_title]
+                if seen.get((norm_title, lang)) == (source_rev, translated_rev):
+                    counts["cached"] += 1
+                    continue
+                yield source_rev, translated_rev, norm_title, lang, props
+
+    def _sync(page):
+        source_rev, translated_rev, norm_title, lang, props = page
+        page_counts = _sync_page(cfg, client, args, str(source_rev), norm_title, lang, props)
+        return page, page_counts
+
+    # Each page is a chain of independent API round-trips, so overlap them;
+    # pages are dispatched as soon as their title batch has been resolved.
+    with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as executor:
+        for page, page_counts in executor.map(_sync, _pages()):
+            counts.update(page_counts)
+            if page_counts["synced"]:
+                source_rev, translated_rev, norm_title, lang, _ = page
+                synced.append((norm_title, lang, source_rev, translated_rev))
+
+    if use_cache and not args.dry_run:
+        with get_conn(cfg.pg_dsn) as conn:
+            set_status_sync_revs(conn, synced)
 
     print(
-        f"summary scanned={scanned} edited={edited} skipped={skipped} "
-        f"missing={missing} approved={approved} errors={errors}"
+        f"summary scanned={counts['scanned']} edited={counts['edited']} skipped={counts['skipped']} "
+        f"missing={counts['missing']} approved={counts['approved']} errors={counts['errors']} "
+        f"cached={counts['cached']}"
     )
 
 
@@ -2,31 +2,46 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from itertools import islice
 from typing import Iterable
 
 import psycopg
 
 log = logging.getLogger("bot.tracker")
 
+UPSERT_PAGES_CHUNK = 1000
 
-@dataclass
+
+@dataclass(slots=True)
 class PageRecord:
     title: str
     source_lang: str
     last_source_rev: int | None
 
 
-def upsert_page(conn: psycopg.Connection, title: str, source_lang: str, rev_id: int) -> None:
+def upsert_pages(conn: psycopg.Connection, rows: Iterable[tuple[str, str, int]]) -> None:
+    # rows are (title, source_lang, last_source_rev); one executemany per chunk
+    # instead of a round-trip per page.
+    rows = iter(rows)
+    chunk = list(islice(rows, UPSERT_PAGES_CHUNK))
+    if not chunk:
+        return
     with conn.cursor() as cur:
-        cur.execute(
-            """
-            INSERT INTO pages (title, source_lang, last_source_rev)
-            VALUES (%s, %s, %s)
-            ON CONFLICT (title)
-            DO UPDATE SET last_source_rev = EXCLUDED.last_source_rev
-            """,
-            (title, source_lang, rev_id),
-        )
+        while chunk:
+            cur.executemany(
+                """
+                INSERT INTO pages (title, source_lang, last_source_rev)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (title)
+                DO UPDATE SET last_source_rev = EXCLUDED.last_source_rev
+                """,
+                chunk,
+            )
+            chunk = list(islice(rows, UPSERT_PAGES_CHUNK))
+
+
+def upsert_page(conn: psycopg.Connection, title: str, source_lang: str, rev_id: int) -> None:
+    upsert_pages(conn, [(title, source_lang, rev_id)])
 
 
 def get_page(conn: psycopg.Connection, title: str) -> PageRecord | None:
@@ -39,3 +54,17 @@ def get_page(conn: psycopg.Connection, title: str) -> PageRecord | None:
         if not row:
             return None
         return PageRecord(*row)
+
+
+def get_pages(conn: psycopg.Connection, titles: Iterable[str]) -> dict[str, PageRecord | None]:
+    # Titles without a row map to None, like get_page.
+    titles = list(dict.fromkeys(titles))
+    if not titles:
+        return {}
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT title, source_lang, last_source_rev FROM pages WHERE title = ANY(%s)",
+            (titles,),
+        )
+        found = {row[0]: PageRecord(*row) for row in cur.fetchall()}
+    return {title: found.get(title) for title in titles}
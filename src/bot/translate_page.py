@@ -6,27 +6,38 @@ import logging
 import time
 import re
 import hashlib
+import threading
 import difflib
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse
 
-from .config import load_config
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is an optional speedup (the "speedups" extra)
+    ahocorasick = None
+
+from .config import Config, load_config
 from .db import (
     get_conn,
     fetch_termbase,
     fetch_segment_checksums,
-    fetch_cached_translation,
-    fetch_cached_translation_by_checksum,
+    fetch_cached_translations,
+    fetch_cached_translations_by_checksum,
     upsert_segment,
     upsert_translation,
 )
 from .engines.google_v3 import GoogleTranslateV3
+from .engines.passthrough import PassthroughEngine
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient, MediaWikiError
+from .mediawiki import MediaWikiClient, MediaWikiError, build_session
 from .placeholders import protect_wikitext, restore_wikitext
-from .segmenter import split_translate_units, Segment
+from .segmenter import SEGMENT_RE, TRANSLATE_TAG_RE, split_translate_units, Segment
 from .transliteration import sr_cyrillic_to_latin
 
+log = logging.getLogger("translate")
+
 
 def _resolve_project_id(cfg_project_id: str | None, credentials_path: str | None) -> str | None:
     if cfg_project_id:
@@ -41,10 +52,30 @@ def _resolve_project_id(cfg_project_id: str | None, credentials_path: str | None
         return None
 
 
+class _EditPacer:
+    # Spaces calls at least `interval` seconds apart across threads.
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 def _unit_title(page_title: str, unit_key: str, lang: str) -> str:
     return f"Translations:{page_title}/{unit_key}/{lang}"
 
 
+DISPLAY_TITLE_WORKERS = 8
+EDIT_WORKERS = 4
 LINK_RE = re.compile(r"\[\[([^\]|]+)(?:\|([^\]]+))?\]\]")
 FILE_LINK_RE = re.compile(r"\[\[(?:File|Image):[^\]]+\]\]", re.IGNORECASE)
 NS_LINK_RE = re.compile(r"\[\[\s*([^|\]:#]+)\s*:(.*?)\]\]")
@@ -74,6 +105,40 @@ LEADING_META_LINE_RE = re.compile(
 )
 RESOURCE_ROW_START_RE = re.compile(r"\{\{\s*ResourceRow\b", re.IGNORECASE)
 RESOURCE_ROW_PARAM_RE = re.compile(r"(?mi)^(\s*\|\s*)([^=\n]+?)(\s*=\s*)")
+BLANK_LINES_RE = re.compile(r"\n{3,}")
+LEADING_DIRECTIVES_RE = re.compile(
+    r"(\{\{DISPLAYTITLE:[^}]+\}\})\s*\n+\s*(__NOTOC__)?\s*\n+\s*(\[\[File:[^\]]+\]\])",
+    re.IGNORECASE,
+)
+NOTOC_DIV_GAP_RE = re.compile(r"(__NOTOC__)\s*\n+\s*(<div\b)")
+DISPLAYTITLE_NOTOC_DIV_GAP_RE = re.compile(
+    r"(\{\{DISPLAYTITLE:[^}]+\}\})\s*\n+\s*(__NOTOC__)\s*\n+\s*(<div\b)"
+)
+STATUS_DISPLAYTITLE_GAP_RE = re.compile(
+    r"(\{\{\s*Translation_status\b[^{}]*\}\})\s*\n+\s*(\{\{DISPLAYTITLE:[^}]+\}\})",
+    re.IGNORECASE,
+)
+DISPLAYTITLE_NOTOC_GAP_RE = re.compile(
+    r"(\{\{DISPLAYTITLE:[^}]+\}\})\s*\n+\s*(__NOTOC__)", re.IGNORECASE
+)
+NOTOC_FILE_GAP_RE = re.compile(r"(__NOTOC__)\s*\n+\s*(\[\[File:[^\]]+\]\])", re.IGNORECASE)
+NOTOC_TRAILING_WS_RE = re.compile(r"(__NOTOC__)\s+(?=\S)", re.IGNORECASE)
+LEADING_METADATA_SPACER_RE = re.compile(
+    r"^((?:\{\{\s*Translation_status\b[^{}]*\}\})?(?:\{\{DISPLAYTITLE:[^}]+\}\})(?:__NOTOC__)?(?:\[\[File:[^\]]+\]\])?)\s*\n{2,}",
+    re.IGNORECASE,
+)
+PARAM_KEY_SEP_RE = re.compile(r"[\s_]+")
+LEAD_WS_RE = re.compile(r"^\s*")
+TRAIL_WS_RE = re.compile(r"\s*$")
+LATIN_LETTER_RE = re.compile(r"[A-Za-z]")
+CATEGORY_LINK_START_RE = re.compile(r"\[\[\s*Category\s*:", re.IGNORECASE)
+HEADING_BODY_GAP_RE = re.compile(r"(={2,6}[^\n]*={2,6})\n{2,}")
+HEADING_GLUED_BODY_RE = re.compile(r"(={2,6}[^\n]*={2,6})[ \t]+([^\n])")
+HEADING_SPLIT_RE = re.compile(r"(?m)^([ \t]*)(={2,6})[ \t]*\n[ \t]*([^\n]+?)[ \t]*(\2)[ \t]*$")
+HEADING_LINE_RE = re.compile(r"[ \t]*(={2,6})[ \t]*([^\n]*?)[ \t]*\1[ \t]*")
+HEADING_LIST_PREFIX_RE = re.compile(r"^\s*[*#:;]\s*(?=={2})")
+EMPTY_PARAGRAPH_SENTINEL = "__EMPTY_PARAGRAPH__"
+EMPTY_PARAGRAPH_LINE_RE = re.compile(rf"\n[ \t]*{EMPTY_PARAGRAPH_SENTINEL}[ \t]*\n")
 
 
 def _is_safe_internal_link(target: str) -> bool:
@@ -90,7 +155,7 @@ def _strip_known_lang_suffix(page: str, known_langs: set[str]) -> str:
 
 
 def _normalize_param_key(name: str) -> str:
-    return re.sub(r"[\s_]+", "", name).strip().lower()
+    return PARAM_KEY_SEP_RE.sub("", name).strip().lower()
 
 
 def _append_lang_suffix_to_internal_page(
@@ -129,8 +194,8 @@ def _append_lang_suffix_to_internal_url(url: str, lang: str, mw_api_url: str) ->
         return url
     new_path = f"{path}/{lang}"
     rebuilt = urlunparse((parsed.scheme, parsed.netloc, new_path, "", "", ""))
-    lead = re.match(r"^\s*", url).group(0)
-    trail = re.search(r"\s*$", url).group(0)
+    lead = LEAD_WS_RE.match(url).group(0)
+    trail = TRAIL_WS_RE.search(url).group(0)
     return f"{lead}{rebuilt}{trail}"
 
 
@@ -175,8 +240,8 @@ def _localize_resource_row_internal_targets(
             if key == "url":
                 value = _append_lang_suffix_to_internal_url(value, lang, mw_api_url)
             elif key == "creatorlink":
-                lead = re.match(r"^\s*", value).group(0)
-                trail = re.search(r"\s*$", value).group(0)
+                lead = LEAD_WS_RE.match(value).group(0)
+                trail = TRAIL_WS_RE.search(value).group(0)
                 core = value.strip()
                 localized = _append_lang_suffix_to_internal_page(core, lang, known_langs=known_langs)
                 value = f"{lead}{localized}{trail}"
@@ -255,8 +320,8 @@ def _translate_resource_row_templates(
             value = body[value_start:value_end]
             should_translate = key not in preserve and (not allowed or key in allowed)
             if should_translate and value.strip():
-                lead = re.match(r"^\s*", value).group(0)
-                trail = re.search(r"\s*$", value).group(0)
+                lead = LEAD_WS_RE.match(value).group(0)
+                trail = TRAIL_WS_RE.search(value).group(0)
                 core = value.strip()
                 ph = protect_wikitext(core, protect_links=True)
                 protected_text, nt_placeholders = _protect_terms(ph.text, no_translate_terms)
@@ -354,6 +419,8 @@ def _tokenize_links(
     link_meta: list[tuple[str, str]] = []
     source_targets: set[str] = set()
     required_tokens: set[str] = set()
+    if "[[" not in text:
+        return text, placeholders, link_meta, source_targets, required_tokens
 
     known_langs = known_langs or set()
 
@@ -363,7 +430,7 @@ def _tokenize_links(
         if not _is_safe_internal_link(target):
             return match.group(0)
 
-        page, anchor = (target.split("#", 1) + [""])[:2]
+        page, _, anchor = target.partition("#")
         base_page = _strip_known_lang_suffix(page, known_langs)
         source_targets.add(base_page)
         if page.endswith(f"/{lang}"):
@@ -390,31 +457,39 @@ def _tokenize_links(
 
 
 def _strip_empty_paragraphs(text: str) -> str:
-    sentinel = "__EMPTY_PARAGRAPH__"
-    cleaned = EMPTY_P_RE.sub(sentinel, text)
-    cleaned = re.sub(rf"\n[ \t]*{re.escape(sentinel)}[ \t]*\n", "\n", cleaned)
-    cleaned = cleaned.replace(sentinel, "")
+    cleaned, count = EMPTY_P_RE.subn(EMPTY_PARAGRAPH_SENTINEL, text)
+    if not count and EMPTY_PARAGRAPH_SENTINEL not in text:
+        # Common case: nothing to remove, skip the sentinel passes.
+        return text.strip()
+    cleaned = EMPTY_PARAGRAPH_LINE_RE.sub("\n", cleaned)
+    cleaned = cleaned.replace(EMPTY_PARAGRAPH_SENTINEL, "")
     return cleaned.strip()
 
 def _collapse_blank_lines(text: str) -> str:
     # Collapse 3+ newlines to 2 and trim leading blank lines.
-    while "\n\n\n" in text:
-        text = text.replace("\n\n\n", "\n\n")
-    return text.lstrip("\n")
+    return BLANK_LINES_RE.sub("\n\n", text).lstrip("\n")
 
 
 def _strip_unresolved_placeholders(text: str) -> str:
-    return UNRESOLVED_PLACEHOLDER_RE.sub("", text)
+    if "__" not in text:
+        return text
+    # Removing a token can join its neighbours into a new one; repeat until clean.
+    text, count = UNRESOLVED_PLACEHOLDER_RE.subn("", text)
+    while count:
+        text, count = UNRESOLVED_PLACEHOLDER_RE.subn("", text)
+    return text
 
 
 def _is_nonlinguistic_segment(text: str) -> bool:
     # Treat markup-only/structural units as copy-through to avoid unnecessary MT calls.
     # Source language is English, so ASCII letters are a sufficient prose signal.
-    return re.search(r"[A-Za-z]", text) is None
+    return LATIN_LETTER_RE.search(text) is None
 
 
 def _restore_missing_refs_from_source(source: str, translated: str) -> str:
     # MT can occasionally drop <ref> blocks; enforce source ref preservation.
+    if "<" not in source:
+        return translated
     refs = REF_TOKEN_RE.findall(source)
     if not refs:
         return translated
@@ -434,13 +509,17 @@ def _restore_underdevelopment_from_source(source: str, translated: str) -> str:
     return f"{translated}\n{{{{UnderDevelopment}}}}"
 
 
+@lru_cache(maxsize=64)
+def _template_re(template_name: str) -> re.Pattern:
+    # Allow underscores/spaces in both source and configured template names.
+    token = re.escape(template_name).replace(r"\ ", r"[ _]+")
+    return re.compile(r"\{\{\s*" + token + r"\b", re.IGNORECASE)
+
+
 def _has_template(text: str, template_name: str) -> bool:
     if not template_name.strip():
         return False
-    # Allow underscores/spaces in both source and configured template names.
-    token = re.escape(template_name.strip()).replace(r"\ ", r"[ _]+")
-    pattern = re.compile(r"\{\{\s*" + token + r"\b", re.IGNORECASE)
-    return bool(pattern.search(text))
+    return bool(_template_re(template_name.strip()).search(text))
 
 
 def _cache_compatible_with_source(
@@ -458,6 +537,8 @@ def _cache_compatible_with_source(
 
 def _restore_magic_words_from_source(source: str, translated: str) -> str:
     # Preserve MediaWiki magic words (for example __NOTOC__) if MT drops them.
+    if "__" not in source:
+        return translated
     source_words = {m.group(0) for m in MAGIC_WORD_RE.finditer(source)}
     if not source_words:
         return translated
@@ -488,6 +569,8 @@ def _dedupe_displaytitle(text: str) -> str:
 
 
 def _extract_displaytitle(text: str) -> str | None:
+    if "{{" not in text:
+        return None
     match = DISPLAYTITLE_RE.search(text)
     if not match:
         return None
@@ -556,6 +639,8 @@ def _upsert_page_display_title_unit(
 
 
 def _remove_disclaimer_tables(text: str) -> str:
+    if "translation-disclaimer" not in text:
+        return text.strip()
     return DISCLAIMER_TABLE_RE.sub("", text).strip()
 
 
@@ -664,7 +749,6 @@ def _write_ai_status_with_retry(
     source_title: str | None = None,
     source_lang: str | None = None,
 ) -> None:
-    logger = logging.getLogger("translate")
     for attempt in range(2):
         try:
             client.set_ai_translation_status(
@@ -675,7 +759,7 @@ def _write_ai_status_with_retry(
                 source_title=source_title,
                 source_lang=source_lang,
             )
-            logger.info(
+            log.info(
                 "updated ai metadata for %s (status=%s, source_rev=%s)",
                 translated_title,
                 status,
@@ -686,7 +770,7 @@ def _write_ai_status_with_retry(
             if attempt == 0:
                 time.sleep(1)
                 continue
-            logger.warning(
+            log.warning(
                 "failed to update ai translation metadata for %s (status=%s, source_rev=%s): %s",
                 translated_title,
                 status,
@@ -714,6 +798,8 @@ def _translation_status_from_unit1(
 
 
 def _restore_file_links(source: str, translated: str) -> str:
+    if "[[" not in source:
+        return translated
     source_links = FILE_LINK_RE.findall(source)
     if not source_links:
         return translated
@@ -721,9 +807,12 @@ def _restore_file_links(source: str, translated: str) -> str:
     if not translated_links:
         prefix = "\n".join(source_links)
         return f"{prefix}\n{translated}" if translated else prefix
-    out = translated
-    for src, tr in zip(source_links, translated_links):
-        out = out.replace(tr, src, 1)
+    if translated_links[: len(source_links)] == source_links:
+        # Already restored (the edit loop re-applies this to every unit).
+        return translated
+    # Pair links by position in one scan instead of rescanning the text per link.
+    replacements = iter(source_links)
+    out = FILE_LINK_RE.sub(lambda _: next(replacements), translated, count=len(source_links))
     if len(source_links) > len(translated_links):
         extra = "\n".join(source_links[len(translated_links):])
         out = f"{extra}\n{out}"
@@ -731,6 +820,8 @@ def _restore_file_links(source: str, translated: str) -> str:
 
 
 def _restore_html_tags(source: str, translated: str) -> str:
+    if "<" not in source:
+        return translated
     source_tags = HTML_TAG_RE.findall(source)
     if not source_tags:
         return translated
@@ -744,9 +835,9 @@ def _restore_html_tags(source: str, translated: str) -> str:
 
 
 def _restore_category_namespace(source: str, translated: str) -> str:
-    source_category_count = len(
-        re.findall(r"\[\[\s*Category\s*:", source, flags=re.IGNORECASE)
-    )
+    if "[[" not in source:
+        return translated
+    source_category_count = len(CATEGORY_LINK_START_RE.findall(source))
     if source_category_count == 0:
         return translated
 
@@ -770,6 +861,8 @@ def _restore_category_namespace(source: str, translated: str) -> str:
 def _restore_internal_link_targets(
     source: str, translated: str, lang: str, known_langs: set[str] | None = None
 ) -> str:
+    if "[[" not in source or "[[" not in translated:
+        return translated
     known_langs = known_langs or set()
     source_links = [m for m in LINK_RE.finditer(source) if _is_safe_internal_link(m.group(1))]
     translated_links = [m for m in LINK_RE.finditer(translated) if _is_safe_internal_link(m.group(1))]
@@ -778,7 +871,7 @@ def _restore_internal_link_targets(
     out = translated
     for src, tr in zip(source_links, translated_links):
         src_target = src.group(1)
-        src_page, src_anchor = (src_target.split("#", 1) + [""])[:2]
+        src_page, _, src_anchor = src_target.partition("#")
         src_base_page = _strip_known_lang_suffix(src_page, known_langs)
         if src_page.endswith(f"/{lang}"):
             new_page = src_page
@@ -792,16 +885,14 @@ def _restore_internal_link_targets(
 
 
 def _normalize_heading_body_spacing(text: str) -> str:
+    if "==" not in text:
+        return text
     # Keep only one newline between a heading line and the following body line.
-    text = re.sub(r"(={2,6}[^\n]*={2,6})\n{2,}", r"\1\n", text)
+    text = HEADING_BODY_GAP_RE.sub(r"\1\n", text)
     # If MT glues heading and body on one line, split after closing heading marker.
-    text = re.sub(r"(={2,6}[^\n]*={2,6})[ \t]+([^\n])", r"\1\n\2", text)
+    text = HEADING_GLUED_BODY_RE.sub(r"\1\n\2", text)
     # If MT splits a heading across lines, merge back to one valid heading line.
-    text = re.sub(
-        r"(?m)^([ \t]*)(={2,6})[ \t]*\n[ \t]*([^\n]+?)[ \t]*(\2)[ \t]*$",
-        r"\1\2 \3 \4",
-        text,
-    )
+    text = HEADING_SPLIT_RE.sub(r"\1\2 \3 \4", text)
     return text
 
 
@@ -830,8 +921,11 @@ def _first_source_unit_key(client: MediaWikiClient, norm_title: str, source_lang
     return "1"
 
 
+_sha256 = hashlib.sha256
+
+
 def _checksum(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return _sha256(text.encode("utf-8")).hexdigest()
 
 
 def _toggle_trailing_newline(text: str) -> str:
@@ -848,19 +942,21 @@ def _normalized_text_equivalent(text: str) -> str:
 
 
 def _fix_broken_links(text: str, lang: str) -> str:
+    if "[[__" not in text:
+        return text
+
     def _repl(match: re.Match) -> str:
         display = match.group(1)
         return f"[[{display}/{lang}|{display}]]"
     return BROKEN_LINK_RE.sub(_repl, text)
 
 
-def _rewrite_internal_links_to_lang_with_source(
-    text: str,
+def _internal_link_rewriter(
     lang: str,
     source_targets: set[str],
     implicit_display_by_target: dict[str, str] | None = None,
     known_langs: set[str] | None = None,
-) -> str:
+):
     implicit_display_by_target = implicit_display_by_target or {}
     known_langs = set(known_langs or set())
     known_langs.add(lang)
@@ -875,7 +971,7 @@ def _rewrite_internal_links_to_lang_with_source(
         display = display_raw or target
         if not _is_safe_internal_link(target):
             return match.group(0)
-        page, anchor = (target.split("#", 1) + [""])[:2]
+        page, _, anchor = target.partition("#")
         base_page = _trim_lang_suffix(page)
         if page.endswith(f"/{lang}") or base_page not in source_targets:
             new_target = page
@@ -896,9 +992,68 @@ def _rewrite_internal_links_to_lang_with_source(
         if display == target or display == new_target:
             display = _trim_lang_suffix(display)
         return f"[[{new_target}|{display}]]"
+    return _repl
+
+
+def _rewrite_internal_links_to_lang_with_source(
+    text: str,
+    lang: str,
+    source_targets: set[str],
+    implicit_display_by_target: dict[str, str] | None = None,
+    known_langs: set[str] | None = None,
+) -> str:
+    if "[[" not in text:
+        return text
+    rewrite = _internal_link_rewriter(lang, source_targets, implicit_display_by_target, known_langs)
+    return LINK_RE.sub(rewrite, text)
+
+
+def _finalize_links(
+    text: str,
+    lang: str,
+    source_targets: set[str],
+    display_by_target: dict[str, str] | None = None,
+    implicit_display_by_target: dict[str, str] | None = None,
+    known_langs: set[str] | None = None,
+) -> str:
+    # One LINK_RE walk applying, per link: translated display text, broken
+    # placeholder-link repair (_fix_broken_links) and the /lang target rewrite.
+    if "[[" not in text:
+        return text
+    rewrite = _internal_link_rewriter(lang, source_targets, implicit_display_by_target, known_langs)
+
+    def _repl(match: re.Match) -> str:
+        link = match.group(0)
+        if display_by_target:
+            target = match.group(1)
+            display = match.group(2) or target
+            if target in display_by_target:
+                display = display_by_target[target]
+            link = f"[[{target}|{display}]]"
+        if "[[__" in link:
+            link = _fix_broken_links(link, lang)
+        relinked = LINK_RE.fullmatch(link)
+        if relinked:
+            return rewrite(relinked)
+        # Malformed nesting such as "[[a [[b]]": rescan just this span.
+        return LINK_RE.sub(rewrite, link)
+
     return LINK_RE.sub(_repl, text)
 
 
+def _translate_unique(
+    engine, texts: list[str], source_lang: str, target_lang: str, glossary_id: str | None = None
+) -> list:
+    # Identical inputs (boilerplate units, repeated labels) are billed once and
+    # fanned back out in the original order.
+    unique = list(dict.fromkeys(texts))
+    if len(unique) == len(texts):
+        return engine.translate(texts, source_lang, target_lang, glossary_id=glossary_id)
+    results = engine.translate(unique, source_lang, target_lang, glossary_id=glossary_id)
+    by_text = dict(zip(unique, results))
+    return [by_text[text] for text in texts]
+
+
 def _translated_target_display_title(
     client: MediaWikiClient, target_page: str, lang: str
 ) -> str | None:
@@ -950,42 +1105,80 @@ def _build_no_translate_terms(
     return terms
 
 
+@lru_cache(maxsize=256)
+def _terms_re(terms: tuple[str, ...], protect: bool) -> re.Pattern:
+    # One alternation with a capture group per term, tried in the given order;
+    # match.lastindex maps a hit back to its term.
+    alternation = "|".join(f"({re.escape(term)})" for term in terms)
+    if protect:
+        return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+    return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
+
 def _protect_terms(text: str, terms: list[tuple[str, str]]) -> tuple[str, dict[str, str]]:
-    if not terms:
+    ordered = sorted((t for t in terms if t[0]), key=lambda t: len(t[0]), reverse=True)
+    ordered = _present_termbase_pairs(text, ordered)
+    if not ordered:
         return text, {}
+    pattern = _terms_re(tuple(term for term, _ in ordered), True)
     placeholders: dict[str, str] = {}
-    for term, preferred in sorted(terms, key=lambda t: len(t[0]), reverse=True):
-        pattern = re.compile(rf"(?<!\w){re.escape(term)}(?!\w)", re.IGNORECASE)
 
-        def _repl(match: re.Match) -> str:
-            token = f"__NT{len(placeholders)}__"
-            placeholders[token] = preferred
-            return token
+    def _repl(match: re.Match) -> str:
+        token = f"__NT{len(placeholders)}__"
+        placeholders[token] = ordered[match.lastindex - 1][1]
+        return token
 
-        text = pattern.sub(_repl, text)
-    return text, placeholders
+    return pattern.sub(_repl, text), placeholders
 
 
-def _should_translate_display(display: str, terms: list[tuple[str, str]]) -> bool:
-    if not terms:
-        return True
-    display_norm = display.strip().lower()
-    for term, _ in terms:
-        if display_norm == term.strip().lower():
-            return False
-    return True
+def _should_translate_display(display: str, forbidden_lower: frozenset[str]) -> bool:
+    return display.strip().lower() not in forbidden_lower
 
 
-def _apply_termbase(text: str, entries: list[dict[str, str | bool | None]]) -> str:
-    updated = text
+def _termbase_pairs(entries: list[dict[str, str | bool | None]]) -> list[tuple[str, str]]:
+    pairs = []
     for entry in entries:
         term = entry.get("term") or ""
         preferred = entry.get("preferred") or ""
-        if not term or not preferred:
-            continue
-        pattern = re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE)
-        updated = pattern.sub(preferred, updated)
-    return updated
+        if term and preferred:
+            pairs.append((term, preferred))
+    return pairs
+
+
+@lru_cache(maxsize=64)
+def _terms_automaton(folded_terms: frozenset[str]):
+    automaton = ahocorasick.Automaton()
+    for term in folded_terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+def _fold_case(text: str) -> str:
+    # casefold() over-approximates re.IGNORECASE except for dotted capital I,
+    # which re lowers to a plain "i"; drop the combining dot on both sides.
+    return text.casefold().replace("i\u0307", "i")
+
+
+def _present_termbase_pairs(text: str, pairs: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    # Prefilter: keep only terms that occur in the text, so the alternation
+    # regex is skipped or narrowed to the candidates.
+    if not pairs:
+        return pairs
+    folded = _fold_case(text)
+    if ahocorasick is not None:
+        automaton = _terms_automaton(frozenset(_fold_case(term) for term, _ in pairs))
+        present = {term for _, term in automaton.iter(folded)}
+        return [pair for pair in pairs if _fold_case(pair[0]) in present]
+    return [pair for pair in pairs if _fold_case(pair[0]) in folded]
+
+
+def _apply_termbase(text: str, entries: list[dict[str, str | bool | None]]) -> str:
+    pairs = _present_termbase_pairs(text, _termbase_pairs(entries))
+    if not pairs:
+        return text
+    pattern = _terms_re(tuple(term for term, _ in pairs), False)
+    return pattern.sub(lambda match: pairs[match.lastindex - 1][1], text)
 
 
 def _protect_link_targets(text: str) -> tuple[str, dict[str, str]]:
@@ -1005,75 +1198,64 @@ def _protect_link_targets(text: str) -> tuple[str, dict[str, str]]:
     return LINK_RE.sub(_repl, text), placeholders
 
 
+@lru_cache(maxsize=256)
+def _placeholder_re(tokens: frozenset[str]) -> re.Pattern:
+    return re.compile("|".join(re.escape(t) for t in sorted(tokens, key=len, reverse=True)))
+
+
+def _restore_all(text: str, placeholders: dict[str, str]) -> str:
+    # One alternation pass per nesting level instead of a str.replace per token.
+    # Values can hold tokens of earlier placeholders (a ref inside a template),
+    # so repeat until nothing is left to restore.
+    if not placeholders:
+        return text
+    pattern = _placeholder_re(frozenset(placeholders))
+    for _ in range(8):
+        text, count = pattern.subn(lambda match: placeholders[match.group(0)], text)
+        if not count:
+            break
+    return text
+
+
 def _apply_termbase_safe(text: str, entries: list[dict[str, str | bool | None]]) -> str:
-    if not entries:
+    pairs = _present_termbase_pairs(text, _termbase_pairs(entries))
+    if not pairs:
+        return text
+    pattern = _terms_re(tuple(term for term, _ in pairs), False)
+    # Most units contain no termbase hit; skip the link-target protect/restore passes then.
+    if not pattern.search(text):
         return text
     protected, placeholders = _protect_link_targets(text)
-    updated = _apply_termbase(protected, entries)
-    return restore_wikitext(updated, placeholders)
+    updated = pattern.sub(lambda match: pairs[match.lastindex - 1][1], protected)
+    return _restore_all(updated, placeholders)
 
 
 def _normalize_leading_directives(text: str) -> str:
-    pattern = re.compile(
-        r"(\{\{DISPLAYTITLE:[^}]+\}\})\s*\n+\s*(__NOTOC__)?\s*\n+\s*(\[\[File:[^\]]+\]\])",
-        re.IGNORECASE,
-    )
-
     def _repl(match: re.Match) -> str:
         display = match.group(1)
         notoc = match.group(2) or ""
         filetag = match.group(3)
         return f"{display}{notoc}{filetag}"
 
-    return pattern.sub(_repl, text, count=1)
+    return LEADING_DIRECTIVES_RE.sub(_repl, text, count=1)
 
 
 def _normalize_leading_div(text: str) -> str:
     # Avoid leading blank line/paragraph before a top-level div.
-    text = re.sub(r"(__NOTOC__)\s*\n+\s*(<div\b)", r"\1\2", text, count=1)
-    text = re.sub(r"(\{\{DISPLAYTITLE:[^}]+\}\})\s*\n+\s*(__NOTOC__)\s*\n+\s*(<div\b)", r"\1__NOTOC__\3", text, count=1)
+    text = NOTOC_DIV_GAP_RE.sub(r"\1\2", text, count=1)
+    text = DISPLAYTITLE_NOTOC_DIV_GAP_RE.sub(r"\1__NOTOC__\3", text, count=1)
     return text
 
 
 def _normalize_leading_status_directives(text: str) -> str:
     # Compact top metadata/directives into a single leading line:
     # {{Translation_status...}}{{DISPLAYTITLE:...}}__NOTOC__[[File:...]]
-    text = re.sub(
-        r"(\{\{\s*Translation_status\b[^{}]*\}\})\s*\n+\s*(\{\{DISPLAYTITLE:[^}]+\}\})",
-        r"\1\2",
-        text,
-        count=1,
-        flags=re.IGNORECASE,
-    )
-    text = re.sub(
-        r"(\{\{DISPLAYTITLE:[^}]+\}\})\s*\n+\s*(__NOTOC__)",
-        r"\1__NOTOC__",
-        text,
-        count=1,
-        flags=re.IGNORECASE,
-    )
-    text = re.sub(
-        r"(__NOTOC__)\s*\n+\s*(\[\[File:[^\]]+\]\])",
-        r"\1\2",
-        text,
-        count=1,
-        flags=re.IGNORECASE,
-    )
-    text = re.sub(
-        r"(__NOTOC__)\s+(?=\S)",
-        r"\1",
-        text,
-        count=1,
-        flags=re.IGNORECASE,
-    )
+    text = STATUS_DISPLAYTITLE_GAP_RE.sub(r"\1\2", text, count=1)
+    text = DISPLAYTITLE_NOTOC_GAP_RE.sub(r"\1__NOTOC__", text, count=1)
+    text = NOTOC_FILE_GAP_RE.sub(r"\1\2", text, count=1)
+    text = NOTOC_TRAILING_WS_RE.sub(r"\1", text, count=1)
     # Do not leave an empty spacer line before content after top metadata.
-    text = re.sub(
-        r"^((?:\{\{\s*Translation_status\b[^{}]*\}\})?(?:\{\{DISPLAYTITLE:[^}]+\}\})(?:__NOTOC__)?(?:\[\[File:[^\]]+\]\])?)\s*\n{2,}",
-        r"\1\n",
-        text,
-        count=1,
-        flags=re.IGNORECASE,
-    )
+    text = LEADING_METADATA_SPACER_RE.sub(r"\1\n", text, count=1)
     return text
 
 
@@ -1111,20 +1293,59 @@ def _compact_leading_metadata_preamble(text: str) -> str:
     return "".join(preamble)
 
 
+def _equal_ignoring_edge_ws(a: str, b: str) -> bool:
+    # Same result as a.strip() == b.strip(). The identity, equality and length
+    # checks settle most calls without copying; only cores of equal length
+    # are sliced for the final comparison.
+    if a is b or a == b:
+        return True
+    start_a = start_b = 0
+    end_a, end_b = len(a), len(b)
+    while start_a < end_a and a[start_a].isspace():
+        start_a += 1
+    while start_b < end_b and b[start_b].isspace():
+        start_b += 1
+    while end_a > start_a and a[end_a - 1].isspace():
+        end_a -= 1
+    while end_b > start_b and b[end_b - 1].isspace():
+        end_b -= 1
+    if end_a - start_a != end_b - start_b:
+        return False
+    return a[start_a:end_a] == b[start_b:end_b]
+
+
+def _normalize_unit1(text: str) -> str:
+    # Equivalent to running the unit1 normalizers in sequence, but skips the
+    # passes whose literal anchors are absent instead of rescanning the text.
+    if "translation-disclaimer" in text:
+        text = DISCLAIMER_TABLE_RE.sub("", text)
+    text = text.strip()
+    if "{{" in text or "__" in text:
+        if "[[" in text:
+            text = _normalize_leading_directives(text)
+        text = _normalize_leading_status_directives(text)
+        if "__NOTOC__" in text:
+            text = _normalize_leading_div(text)
+    text = _compact_leading_metadata_preamble(text)
+    return _collapse_blank_lines(text)
+
+
 def _normalize_heading_lines(text: str) -> str:
     def _repl(match: re.Match) -> str:
         eq = match.group(1)
         title = match.group(2).strip()
         return f"\n{eq} {title} {eq}\n"
 
-    return re.sub(r"[ \t]*(={2,6})[ \t]*([^\n]*?)[ \t]*\1[ \t]*", _repl, text)
+    if "==" not in text:
+        return text
+    return HEADING_LINE_RE.sub(_repl, text)
 
 
 def _strip_heading_list_prefix(text: str) -> str:
     lines: list[str] = []
     for line in text.splitlines():
-        if re.match(r"^\s*[*#:;]\s*={2,6}", line):
-            line = re.sub(r"^\s*[*#:;]\s*", "", line)
+        if HEADING_LIST_PREFIX_RE.match(line):
+            line = HEADING_LIST_PREFIX_RE.sub("", line, count=1)
         lines.append(line)
     return "\n".join(lines)
 
@@ -1173,15 +1394,22 @@ def _fetch_unit_sources(
     client: MediaWikiClient, norm_title: str, keys: list[str], source_lang: str
 ) -> list[Segment]:
     segments: list[Segment] = []
-    for key in keys:
-        unit_title = f"Translations:{norm_title}/{key}/{source_lang}"
-        try:
-            text, _, _ = client.get_page_wikitext(unit_title)
-        except MediaWikiError as exc:
-            logging.getLogger("translate").warning(
-                "missing translation unit %s: %s", unit_title, exc
-            )
-            return []
+    unit_titles = {key: f"Translations:{norm_title}/{key}/{source_lang}" for key in keys}
+    # One query per 50 units; anything the bulk read skipped is fetched singly.
+    try:
+        texts = client.get_pages_wikitext(list(unit_titles.values()))
+    except MediaWikiError:
+        texts = {}
+    for key, unit_title in unit_titles.items():
+        text = texts.get(unit_title)
+        if text is None:
+            try:
+                text, _, _ = client.get_page_wikitext(unit_title)
+            except MediaWikiError as exc:
+                log.warning(
+                    "missing translation unit %s: %s", unit_title, exc
+                )
+                return []
         segments.append(Segment(key=key, text=text.strip()))
     return segments
 
@@ -1203,27 +1431,19 @@ def _fetch_messagecollection_segments(
 
 
 def assemble_translated_page(wikitext: str, translations: dict[str, str]) -> str:
-    output = []
-    matches = list(re.finditer(r"<!--T:(\d+)-->", wikitext))
-    if not matches:
+    first = SEGMENT_RE.search(wikitext)
+    if first is None:
         return wikitext
-
-    cursor = 0
-    for idx, match in enumerate(matches):
-        output.append(wikitext[cursor:match.start()])
-        key = match.group(1)
-        translated = translations.get(key, "")
-        output.append(translated)
-        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(wikitext)
-        cursor = end
-
-    output.append(wikitext[cursor:])
-    combined = "".join(output)
-    combined = re.sub(r"</?translate>", "", combined)
+    # Each unit runs up to the next marker, so the page is the text before the
+    # first marker followed by the translations in marker order.
+    keys = SEGMENT_RE.findall(wikitext, first.start())
+    combined = wikitext[: first.start()] + "".join(translations.get(key, "") for key in keys)
+    if "translate>" in combined:
+        combined = TRANSLATE_TAG_RE.sub("", combined)
     return combined.strip() + "\n"
 
 
-def main() -> None:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("--title", required=True)
     parser.add_argument("--lang", default="sr")
@@ -1243,14 +1463,41 @@ def main() -> None:
     parser.add_argument("--auto-review", action="store_true", default=False)
     parser.add_argument("--no-auto-review", action="store_false", dest="auto_review")
     parser.add_argument("--dry-run", action="store_true")
-    args = parser.parse_args()
+    return parser
 
-    configure_logging()
-    cfg = load_config()
 
-    session = __import__("requests").Session()
-    client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
-    client.login(cfg.mw_username, cfg.mw_password)
+@lru_cache(maxsize=1)
+def _default_args() -> dict[str, object]:
+    return vars(_build_parser().parse_args(["--title", ""]))
+
+
+def build_args(title: str, **overrides: object) -> argparse.Namespace:
+    # Same namespace the CLI would produce, without re-parsing argv per page.
+    unknown = set(overrides) - set(_default_args())
+    if unknown:
+        raise TypeError(f"unknown translate_page options: {sorted(unknown)}")
+    return argparse.Namespace(**{**_default_args(), **overrides, "title": title})
+
+
+def main(argv: list[str] | None = None):
+    args = _build_parser().parse_args(argv)
+    configure_logging()
+    return run(args)
+
+
+def run(
+    args: argparse.Namespace,
+    cfg: Config | None = None,
+    client: MediaWikiClient | None = None,
+):
+    # Callers that translate many pages pass their own config and logged-in
+    # client so each page does not pay for a fresh session and login.
+    if cfg is None:
+        cfg = load_config()
+    if client is None:
+        session = build_session(cfg.mw_user_agent)
+        client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
+        client.login(cfg.mw_username, cfg.mw_password)
 
     if args.rebuild_only and args.no_cache:
         raise SystemExit("--rebuild-only cannot be used with --no-cache")
@@ -1264,7 +1511,7 @@ def main() -> None:
             try:
                 _, assembled_rev, _ = client.get_page_wikitext(assembled_title)
                 client.approve_revision(assembled_rev)
-                logging.getLogger("translate").info(
+                log.info(
                     "approved assembled page %s", assembled_title
                 )
                 return {"approve_status": "approved"}
@@ -1272,12 +1519,12 @@ def main() -> None:
                 if "no revisions" in str(exc).lower():
                     if idx < len(backoff):
                         wait = backoff[idx]
-                        logging.getLogger("translate").warning(
+                        log.warning(
                             "approve retry: %s (waiting %ss)", exc, wait
                         )
                         time.sleep(wait)
                         continue
-                    logging.getLogger("translate").warning(
+                    log.warning(
                         "skip approve: %s", exc
                     )
                     return {"approve_status": "no_revisions"}
@@ -1285,7 +1532,7 @@ def main() -> None:
 
     source_wikitext_en, rev_id, norm_title = client.get_page_wikitext(args.title)
     if _is_redirect_wikitext(source_wikitext_en):
-        logging.getLogger("translate").info("skip redirect page: %s", norm_title)
+        log.info("skip redirect page: %s", norm_title)
         return {"status": "skip_redirect", "title": norm_title, "source_rev": str(rev_id)}
     source_rev = str(rev_id)
     translated_page_title = f"{norm_title}/{args.lang}"
@@ -1293,7 +1540,7 @@ def main() -> None:
     try:
         ai_info = client.get_ai_translation_info(translated_page_title)
     except Exception as exc:
-        logging.getLogger("translate").warning(
+        log.warning(
             "failed to read ai translation metadata for %s: %s",
             translated_page_title,
             exc,
@@ -1308,7 +1555,7 @@ def main() -> None:
     if status in ("reviewed", "outdated"):
         source_at_translation = status_meta.get("dr_source_rev_at_translation", "").strip()
         if status == "reviewed" and source_at_translation != source_rev:
-            logging.getLogger("translate").info(
+            log.info(
                 "status lock: %s is reviewed and source changed (%s -> %s); marking outdated",
                 translated_page_title,
                 source_at_translation or "?",
@@ -1329,7 +1576,7 @@ def main() -> None:
                         "Bot: mark translation status as outdated (source changed)",
                         bot=True,
                     )
-                    logging.getLogger("translate").info("edited %s", unit1_title)
+                    log.info("edited %s", unit1_title)
                     _write_ai_status_with_retry(
                         client=client,
                         translated_title=translated_page_title,
@@ -1340,11 +1587,11 @@ def main() -> None:
                         source_lang=cfg.source_lang,
                     )
             except Exception as exc:
-                logging.getLogger("translate").warning(
+                log.warning(
                     "failed to mark outdated for %s: %s", translated_page_title, exc
                 )
             return {"status": "outdated", "title": norm_title, "source_rev": source_rev}
-        logging.getLogger("translate").info(
+        log.info(
             "status lock: skip translation for %s (status=%s)",
             translated_page_title,
             status,
@@ -1354,7 +1601,7 @@ def main() -> None:
     if not segments:
         unit_keys = client.list_translation_unit_keys(norm_title, cfg.source_lang)
         if unit_keys:
-            unit_keys = sorted(set(unit_keys), key=lambda k: int(k))
+            unit_keys = sorted(set(unit_keys), key=int)
             segments = _fetch_unit_sources(
                 client, norm_title, unit_keys, cfg.source_lang
             )
@@ -1365,14 +1612,19 @@ def main() -> None:
     if not segments:
         raise SystemExit("no segments found; is the page marked for translation?")
 
-    deduped: list[Segment] = []
-    seen_keys: set[str] = set()
+    # Dedupe (first occurrence wins), order and window the units once, before
+    # any per-unit fetches below.
+    unique_segments: dict[str, Segment] = {}
     for seg in segments:
-        if seg.key in seen_keys:
-            continue
-        seen_keys.add(seg.key)
-        deduped.append(seg)
-    segments = deduped
+        unique_segments.setdefault(seg.key, seg)
+    # Keys are unique after the dedupe, so segments are never compared.
+    numbered = sorted((int(key), seg) for key, seg in unique_segments.items())
+    metadata_key = numbered[0][1].key if numbered else "1"
+    if args.start_key is not None:
+        numbered = [item for item in numbered if item[0] >= args.start_key]
+    segments = [seg for _, seg in numbered]
+    if args.max_keys is not None and args.max_keys > 0:
+        segments = segments[: args.max_keys]
 
     # Optional reviewed-language pivot, e.g. hr <- sr when sr is reviewed.
     pivot_source_lang = cfg.pivot_reviewed_map.get(args.lang) if cfg.pivot_reviewed_map else None
@@ -1398,7 +1650,7 @@ def main() -> None:
                     pivot_missing += 1
                     pivoted.append(seg)
             segments = pivoted
-            logging.getLogger("translate").info(
+            log.info(
                 "pivot source enabled for %s/%s: %s->%s (missing_units=%s)",
                 norm_title,
                 args.lang,
@@ -1408,7 +1660,7 @@ def main() -> None:
             )
             pivot_active = True
 
-    logging.getLogger("translate").info(
+    log.info(
         "page=%s rev_id=%s segments=%s", args.title, rev_id, len(segments)
     )
 
@@ -1420,16 +1672,10 @@ def main() -> None:
         except Exception:
             termbase_entries = []
 
-    logging.getLogger("translate").info("termbase entries=%s", len(termbase_entries))
+    log.info("termbase entries=%s", len(termbase_entries))
 
     no_translate_terms = _build_no_translate_terms(termbase_entries)
-
-    segments = sorted(segments, key=lambda s: int(s.key))
-    metadata_key = segments[0].key if segments else "1"
-    if args.start_key is not None:
-        segments = [s for s in segments if int(s.key) >= args.start_key]
-    if args.max_keys is not None and args.max_keys > 0:
-        segments = segments[: args.max_keys]
+    forbidden_lower = frozenset(term.strip().lower() for term, _ in no_translate_terms)
 
     segment_checksums: dict[str, str] = {}
     cached_by_key: dict[str, str] = {}
@@ -1466,11 +1712,37 @@ def main() -> None:
         current_keys = {seg.key for seg in segments}
         if set(existing_checksums.keys()) != current_keys:
             disable_cache = True
-            logging.getLogger("translate").warning(
+            log.warning(
                 "segment keys changed for %s; bypassing cache for this run",
                 norm_title,
             )
 
+    cached_by_segment_key: dict[str, str] = {}
+    cached_by_checksum: dict[str, str] = {}
+    if not disable_cache and not args.no_cache and cfg.pg_dsn:
+        lookup = {
+            seg.key: _checksum(seg.text)
+            for seg in segments
+            if not _is_nonlinguistic_segment(seg.text)
+        }
+        # L1 keys only count when the unit map is stable and the checksum matches.
+        l1_lookup = {
+            f"{norm_title}::{key}": checksum
+            for key, checksum in lookup.items()
+            if existing_checksums.get(key) == checksum
+        }
+        try:
+            with get_conn(cfg.pg_dsn) as conn:
+                cached_by_segment_key = fetch_cached_translations(
+                    conn, l1_lookup, args.lang
+                )
+                cached_by_checksum = fetch_cached_translations_by_checksum(
+                    conn, list(lookup.values()), args.lang
+                )
+        except Exception:
+            cached_by_segment_key = {}
+            cached_by_checksum = {}
+
     for seg in segments:
         checksum = _checksum(seg.text)
         segment_checksums[seg.key] = checksum
@@ -1483,42 +1755,30 @@ def main() -> None:
             # Skip checksum cache for this run to avoid reusing stale context.
             pass
         elif not args.no_cache and cfg.pg_dsn:
-            try:
-                with get_conn(cfg.pg_dsn) as conn:
-                    cached = None
-                    # L1: exact page/key cache hit when unit map is stable.
-                    if existing_checksums.get(seg.key) == checksum:
-                        cached = fetch_cached_translation(
-                            conn, f"{norm_title}::{seg.key}", args.lang, checksum
-                        )
-                        if cached:
-                            if _cache_compatible_with_source(
-                                seg.text, cached, cfg.cache_strict_templates
-                            ):
-                                cached_by_key[seg.key] = cached
-                                cached_source_by_key[seg.key] = "db-key"
-                                continue
-                            logging.getLogger("translate").info(
-                                "cache incompatible %s key=%s source=db-key; bypassing cache",
-                                norm_title,
-                                seg.key,
-                            )
-                    # L2: cross-page content cache hit by source checksum.
-                    cached = fetch_cached_translation_by_checksum(conn, checksum, args.lang)
-                if cached:
-                    if _cache_compatible_with_source(
-                        seg.text, cached, cfg.cache_strict_templates
-                    ):
-                        cached_by_key[seg.key] = cached
-                        cached_source_by_key[seg.key] = "db-checksum"
-                    else:
-                        logging.getLogger("translate").info(
-                            "cache incompatible %s key=%s source=db-checksum; bypassing cache",
-                            norm_title,
-                            seg.key,
-                        )
-            except Exception:
-                pass
+            # L1: exact page/key cache hit when unit map is stable.
+            cached = cached_by_segment_key.get(f"{norm_title}::{seg.key}")
+            if cached:
+                if _cache_compatible_with_source(seg.text, cached, cfg.cache_strict_templates):
+                    cached_by_key[seg.key] = cached
+                    cached_source_by_key[seg.key] = "db-key"
+                    continue
+                log.info(
+                    "cache incompatible %s key=%s source=db-key; bypassing cache",
+                    norm_title,
+                    seg.key,
+                )
+            # L2: cross-page content cache hit by source checksum.
+            cached = cached_by_checksum.get(checksum)
+            if cached:
+                if _cache_compatible_with_source(seg.text, cached, cfg.cache_strict_templates):
+                    cached_by_key[seg.key] = cached
+                    cached_source_by_key[seg.key] = "db-checksum"
+                else:
+                    log.info(
+                        "cache incompatible %s key=%s source=db-checksum; bypassing cache",
+                        norm_title,
+                        seg.key,
+                    )
         if args.rebuild_only and seg.key not in cached_by_key:
             unit_title = f"Translations:{norm_title}/{seg.key}/{args.lang}"
             try:
@@ -1530,7 +1790,7 @@ def main() -> None:
                         cached_by_key[seg.key] = unit_text
                         cached_source_by_key[seg.key] = "wiki"
                     else:
-                        logging.getLogger("translate").info(
+                        log.info(
                             "cache incompatible %s key=%s source=wiki; bypassing cache",
                             norm_title,
                             seg.key,
@@ -1551,7 +1811,12 @@ def main() -> None:
         engine_lang = "sr-Latn"
     engine = None
     glossary_id = None
-    if to_translate:
+    if to_translate and args.dry_run:
+        # Dry runs never save units, so run the pipeline on the source text
+        # instead of paying for MT.
+        log.info("DRY RUN skipping machine translation for %s", norm_title)
+        engine = PassthroughEngine()
+    elif to_translate:
         project_id = _resolve_project_id(cfg.gcp_project_id, cfg.gcp_credentials_path)
         if not project_id:
             raise SystemExit("GCP project id is required (set GCP_PROJECT_ID or ensure in credentials)")
@@ -1572,16 +1837,8 @@ def main() -> None:
             title_translation = preferred
             title_locked_by_termbase = True
             break
-    if title_translation is None and engine is not None:
-        title_translation = engine.translate(
-            [source_display_title], translate_source_lang, engine_lang, glossary_id=glossary_id
-        )[0].text
-    if title_translation is None:
-        title_translation = source_display_title
-    if engine_lang == "sr-Latn":
-        title_translation = sr_cyrillic_to_latin(title_translation)
-    if termbase_entries:
-        title_translation = _apply_termbase(title_translation, termbase_entries)
+    # The title rides along in the segment MT request below.
+    title_inputs = [source_display_title] if title_translation is None and engine is not None else []
 
     known_langs = set(cfg.target_langs) | {cfg.source_lang}
     if pivot_active and pivot_source_lang:
@@ -1610,29 +1867,10 @@ def main() -> None:
         result.placeholders.update(link_placeholders)
         result.placeholders.update(no_translate_placeholders)
         for target, display in link_meta:
-            if _should_translate_display(display, no_translate_terms):
+            if _should_translate_display(display, forbidden_lower):
                 link_display_requests[target] = display
         protected.append((seg, result))
 
-    translated = []
-    if protected and engine is not None:
-        translated = engine.translate(
-            [p.text for _, p in protected], translate_source_lang, engine_lang, glossary_id=glossary_id
-        )
-    protected_map: dict[str, tuple[object, object]] = {}
-    for (seg, ph), tr in zip(protected, translated):
-        protected_map[seg.key] = (ph, tr)
-
-    # Translate link display texts to ensure localized anchors
-    link_display_translated: dict[str, str] = {}
-    if link_display_requests and engine is not None:
-        displays = list(link_display_requests.values())
-        translated_displays = engine.translate(
-            displays, translate_source_lang, engine_lang, glossary_id=glossary_id
-        )
-        for (target, _), tr in zip(link_display_requests.items(), translated_displays):
-            link_display_translated[target] = tr.text
-
     implicit_targets: set[str] = set()
     for seg in segments:
         for m in LINK_RE.finditer(seg.text):
@@ -1646,35 +1884,79 @@ def main() -> None:
     # - explicit links where display still equals the source title [[Page|Page]]
     localized_display_by_target: dict[str, str] = {}
     display_targets = set(implicit_targets) | set(source_targets)
-    for target_page in sorted(display_targets):
-        translated_display = _translated_target_display_title(client, target_page, args.lang)
-        if translated_display:
-            localized_display_by_target[target_page] = translated_display
+    sorted_targets = sorted(display_targets)
+    if sorted_targets:
+        # Each lookup is one or two wiki reads; overlap them instead of paying latency serially.
+        with ThreadPoolExecutor(max_workers=DISPLAY_TITLE_WORKERS) as executor:
+            lookups = executor.map(
+                lambda target_page: _translated_target_display_title(client, target_page, args.lang),
+                sorted_targets,
+            )
+            for target_page, translated_display in zip(sorted_targets, lookups):
+                if translated_display:
+                    localized_display_by_target[target_page] = translated_display
     # Fallback for newly added languages: if target page translation does not
     # exist yet, translate the link label itself so users do not see English UI labels.
     missing_targets = [t for t in sorted(display_targets) if t not in localized_display_by_target]
+    fallback_labels: list[str] = []
+    fallback_targets: list[str] = []
     if missing_targets and engine is not None:
-        fallback_labels: list[str] = []
-        fallback_targets: list[str] = []
         for target_page in missing_targets:
             label = target_page.rsplit("/", 1)[-1].replace("_", " ").strip()
             if not label:
                 continue
-            if not _should_translate_display(label, no_translate_terms):
+            if not _should_translate_display(label, forbidden_lower):
                 continue
             fallback_targets.append(target_page)
             fallback_labels.append(label)
-        if fallback_labels:
-            fallback_translated = engine.translate(
-                fallback_labels, translate_source_lang, engine_lang, glossary_id=glossary_id
-            )
-            for target_page, tr in zip(fallback_targets, fallback_translated):
-                value = tr.text
-                if engine_lang == "sr-Latn":
-                    value = sr_cyrillic_to_latin(value)
-                if termbase_entries:
-                    value = _apply_termbase(value, termbase_entries)
-                localized_display_by_target[target_page] = value
+
+    # Title, segment texts, link display texts (for localized anchors) and fallback
+    # link labels share one MT request. Different targets often share a display
+    # label; send each label once (_translate_unique also collapses repeated units).
+    unique_displays = list(dict.fromkeys(link_display_requests.values()))
+    translated = []
+    translated_displays = []
+    fallback_translated = []
+    if (title_inputs or protected or unique_displays or fallback_labels) and engine is not None:
+        combined = title_inputs + [p.text for _, p in protected] + unique_displays + fallback_labels
+        results = _translate_unique(
+            engine, combined, translate_source_lang, engine_lang, glossary_id=glossary_id
+        )
+        if title_inputs:
+            title_translation = results[0].text
+        results = results[len(title_inputs) :]
+        translated = results[: len(protected)]
+        translated_displays = results[len(protected) : len(protected) + len(unique_displays)]
+        fallback_translated = results[len(protected) + len(unique_displays) :]
+    if title_translation is None:
+        title_translation = source_display_title
+    if engine_lang == "sr-Latn":
+        title_translation = sr_cyrillic_to_latin(title_translation)
+    if termbase_entries:
+        title_translation = _apply_termbase(title_translation, termbase_entries)
+    protected_map: dict[str, tuple[object, object]] = {}
+    for (seg, ph), tr in zip(protected, translated):
+        protected_map[seg.key] = (ph, tr)
+
+    display_map: dict[str, str] = {}
+    for display, tr in zip(unique_displays, translated_displays):
+        value = tr.text
+        if engine_lang == "sr-Latn":
+            value = sr_cyrillic_to_latin(value)
+        display_map[display] = value
+    link_display_translated: dict[str, str] = {
+        target: display_map[display]
+        for target, display in link_display_requests.items()
+        if display in display_map
+    }
+
+    for target_page, tr in zip(fallback_targets, fallback_translated):
+        value = tr.text
+        if engine_lang == "sr-Latn":
+            value = sr_cyrillic_to_latin(value)
+        if termbase_entries:
+            value = _apply_termbase(value, termbase_entries)
+        localized_display_by_target[target_page] = value
 
     translated_by_key: dict[str, str] = {}
     ordered_keys: list[str] = []
@@ -1708,7 +1990,7 @@ def main() -> None:
             tr.text, required_link_tokens_by_key.get(seg.key, set())
         )
         if missing_link_tokens:
-            logging.getLogger("translate").warning(
+            log.warning(
                 "link placeholder loss in segment %s for %s/%s: %s; retrying with fully protected links",
                 seg.key,
                 norm_title,
@@ -1729,11 +2011,7 @@ def main() -> None:
         else:
             tr_text = tr.text
 
-        restored = restore_wikitext(tr_text, ph.placeholders)
-        # Safety: restore any leftover placeholders in case MT preserved tokens
-        for token, value in ph.placeholders.items():
-            if token in restored:
-                restored = restored.replace(token, value)
+        restored = _restore_all(tr_text, ph.placeholders)
         restored = _restore_missing_refs_from_source(seg.text, restored)
         restored = _restore_underdevelopment_from_source(seg.text, restored)
         restored = _restore_magic_words_from_source(seg.text, restored)
@@ -1748,24 +2026,12 @@ def main() -> None:
         restored = _align_list_markers(seg.text, restored)
         if engine_lang == "sr-Latn":
             restored = sr_cyrillic_to_latin(restored)
-        if link_display_translated:
-            def _rewrite_display(match: re.Match) -> str:
-                target = match.group(1)
-                display = match.group(2) or target
-                if target in link_display_translated:
-                    new_display = link_display_translated[target]
-                    if engine_lang == "sr-Latn":
-                        new_display = sr_cyrillic_to_latin(new_display)
-                    return f"[[{target}|{new_display}]]"
-                return f"[[{target}|{display}]]"
-
-            restored = LINK_RE.sub(_rewrite_display, restored)
-        restored = _fix_broken_links(restored, args.lang)
-        restored = _rewrite_internal_links_to_lang_with_source(
+        restored = _finalize_links(
             restored,
             args.lang,
             source_targets,
-            localized_display_by_target,
+            display_by_target=link_display_translated,
+            implicit_display_by_target=localized_display_by_target,
             known_langs=known_langs,
         )
         restored = _restore_resource_row_preserve_fields(
@@ -1828,7 +2094,10 @@ def main() -> None:
             displaytitle_value = None
         if displaytitle_value is not None or not args.rebuild_only:
             for key in ordered_keys:
-                translated_by_key[key] = DISPLAYTITLE_RE.sub("", translated_by_key[key]).strip()
+                text = translated_by_key[key]
+                if "{{" in text:
+                    text = DISPLAYTITLE_RE.sub("", text)
+                translated_by_key[key] = text.strip()
         if title_locked_by_termbase:
             # If title is protected by termbase no-translate rules, force the
             # preferred value even when a previous Page display title exists.
@@ -1841,11 +2110,11 @@ def main() -> None:
                     unit_title = _upsert_page_display_title_unit(
                         client, norm_title, args.lang, displaytitle_value
                     )
-                    logging.getLogger("translate").info(
+                    log.info(
                         "edited %s", unit_title
                     )
                 except Exception as exc:
-                    logging.getLogger("translate").warning(
+                    log.warning(
                         "failed to upsert page display title unit for %s/%s: %s",
                         norm_title,
                         args.lang,
@@ -1874,22 +2143,15 @@ def main() -> None:
         )
 
     for key in ordered_keys:
-        translated_by_key[key] = _strip_empty_paragraphs(translated_by_key[key])
-        translated_by_key[key] = _remove_disclaimer_tables(translated_by_key[key])
-        if termbase_entries and key in to_translate_keys:
-            translated_by_key[key] = _apply_termbase_safe(
-                translated_by_key[key], termbase_entries
-            )
+        text = _strip_empty_paragraphs(translated_by_key[key])
+        text = _remove_disclaimer_tables(text)
         if key in to_translate_keys:
-            translated_by_key[key] = _align_list_markers(
-                source_by_key.get(key, ""), translated_by_key[key]
-            )
-        translated_by_key[key] = _strip_unresolved_placeholders(translated_by_key[key])
-
-    # Final pass after status/displaytitle insertion
-    for key in ordered_keys:
-        translated_by_key[key] = _strip_unresolved_placeholders(translated_by_key[key])
+            if termbase_entries:
+                text = _apply_termbase_safe(text, termbase_entries)
+            text = _align_list_markers(source_by_key.get(key, ""), text)
+        translated_by_key[key] = _strip_unresolved_placeholders(text)
 
+    pending_edits: list[tuple[str, str, str]] = []
     for key in ordered_keys:
         if key not in writable_keys:
             continue
@@ -1915,12 +2177,16 @@ def main() -> None:
         restored = _normalize_heading_body_spacing(restored)
         if key == metadata_key:
             restored = _compact_leading_metadata_preamble(restored)
-        unit_title = _unit_title(norm_title, key, args.lang)
-        summary = "Machine translation by bot"
-
         if args.dry_run:
-            logging.getLogger("translate").info("DRY RUN edit %s", unit_title)
+            log.info("DRY RUN edit %s", _unit_title(norm_title, key, args.lang))
             continue
+        pending_edits.append((key, source_text, restored))
+
+    edit_pacer = _EditPacer(args.sleep_ms / 1000.0)
+
+    def _save_unit(key: str, source_text: str, restored: str) -> None:
+        unit_title = _unit_title(norm_title, key, args.lang)
+        summary = "Machine translation by bot"
 
         current_revid_before = 0
         try:
@@ -1930,8 +2196,8 @@ def main() -> None:
                     # Force a harmless edit to clear fuzzy state for this unit.
                     restored = _toggle_trailing_newline(current_text)
                 else:
-                    logging.getLogger("translate").info("skip unchanged %s", unit_title)
-                    continue
+                    log.info("skip unchanged %s", unit_title)
+                    return
         except MediaWikiError:
             # Unit might not exist yet; continue with edit.
             pass
@@ -1939,6 +2205,7 @@ def main() -> None:
         unit_saved = False
         last_verify_error: Exception | None = None
         for attempt in range(2):
+            edit_pacer.wait()
             newrev = client.edit(unit_title, restored, summary, bot=True)
             verify_revid = 0
             try:
@@ -1962,7 +2229,7 @@ def main() -> None:
                 break
             else:
                 if last_verify_error is not None:
-                    logging.getLogger("translate").warning(
+                    log.warning(
                         "edit verify read failed for %s (attempt %d/2): %s",
                         unit_title,
                         attempt + 1,
@@ -1980,13 +2247,13 @@ def main() -> None:
                         )
                     )
                     if diff:
-                        logging.getLogger("translate").warning(
+                        log.warning(
                             "edit verify diff for %s (attempt %d/2):\n%s",
                             unit_title,
                             attempt + 1,
                             diff[:2500],
                         )
-                    logging.getLogger("translate").warning(
+                    log.warning(
                         "edit verify mismatch for %s (attempt %d/2); retrying",
                         unit_title,
                         attempt + 1,
@@ -1998,10 +2265,10 @@ def main() -> None:
                 f"failed to verify persisted unit edit for {unit_title}"
             )
 
-        logging.getLogger("translate").info("edited %s", unit_title)
+        log.info("edited %s", unit_title)
         if args.auto_review and newrev:
             client.translation_review(newrev)
-            logging.getLogger("translate").info("reviewed %s", unit_title)
+            log.info("reviewed %s", unit_title)
         if cfg.pg_dsn:
             try:
                 with get_conn(cfg.pg_dsn) as conn:
@@ -2024,8 +2291,11 @@ def main() -> None:
                     )
             except Exception:
                 pass
-        if args.sleep_ms > 0:
-            time.sleep(args.sleep_ms / 1000.0)
+
+    # Units are separate pages, so save them concurrently; the pacer keeps
+    # edits --sleep-ms apart across all workers.
+    with ThreadPoolExecutor(max_workers=EDIT_WORKERS) as executor:
+        list(executor.map(lambda item: _save_unit(*item), pending_edits))
 
     if args.clear_fuzzy and not args.dry_run:
         # Re-fetch fuzzy status after edits because Translate may mark units fuzzy
@@ -2046,7 +2316,7 @@ def main() -> None:
         except Exception:
             fuzzy_after = set()
 
-        for key in sorted(fuzzy_after, key=lambda x: int(x)):
+        for key in sorted(fuzzy_after, key=int):
             unit_title = _unit_title(norm_title, key, args.lang)
             try:
                 current_text, _, _ = client.get_page_wikitext(unit_title)
@@ -2062,9 +2332,9 @@ def main() -> None:
                     "Bot: clear fuzzy on machine translation",
                     bot=True,
                 )
-                logging.getLogger("translate").info("cleared fuzzy %s", unit_title)
+                log.info("cleared fuzzy %s", unit_title)
             except Exception as exc:
-                logging.getLogger("translate").warning(
+                log.warning(
                     "failed to clear fuzzy for %s: %s", unit_title, exc
                 )
 
@@ -2087,9 +2357,9 @@ def main() -> None:
                 "Bot: sync translation status metadata",
                 bot=True,
             )
-            logging.getLogger("translate").info("edited %s", unit1_title)
+            log.info("edited %s", unit1_title)
         except Exception as exc:
-            logging.getLogger("translate").warning(
+            log.warning(
                 "failed to sync status template for %s/%s: %s",
                 norm_title,
                 args.lang,
@@ -2101,19 +2371,19 @@ def main() -> None:
         try:
             _, assembled_rev, _ = client.get_page_wikitext(assembled_title)
         except MediaWikiError as exc:
-            logging.getLogger("translate").warning(
+            log.warning(
                 "skip approve: %s", exc
             )
             return {"status": "skip_approve_no_revisions", "title": norm_title, "source_rev": source_rev}
         client.approve_revision(assembled_rev)
-        logging.getLogger("translate").info(
+        log.info(
             "approved assembled page %s", assembled_title
         )
         try:
             client.purge(assembled_title, forcelinkupdate=True)
-            logging.getLogger("translate").info("purged %s", assembled_title)
+            log.info("purged %s", assembled_title)
         except Exception as exc:
-            logging.getLogger("translate").warning(
+            log.warning(
                 "failed to purge %s: %s", assembled_title, exc
             )
 
@@ -65,5 +65,8 @@ _MAP = {
 }
 
 
+_TABLE = str.maketrans(_MAP)
+
+
 def sr_cyrillic_to_latin(text: str) -> str:
-    return "".join(_MAP.get(ch, ch) for ch in text)
+    return text.translate(_TABLE)
@@ -5,7 +5,7 @@ import logging
 
 from .config import load_config
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient
+from .mediawiki import MediaWikiClient, build_session
 
 log = logging.getLogger("bot.update_sidebar")
 
@@ -528,7 +528,7 @@ def main() -> None:
 
     configure_logging()
     cfg = load_config()
-    session = __import__("requests").Session()
+    session = build_session(cfg.mw_user_agent)
     client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
     client.login(cfg.mw_username, cfg.mw_password)
 
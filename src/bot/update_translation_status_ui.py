@@ -4,11 +4,9 @@ import argparse
 import logging
 import re
 
-import requests
-
 from .config import load_config
 from .logging import configure_logging
-from .mediawiki import MediaWikiClient
+from .mediawiki import MediaWikiClient, build_session
 
 log = logging.getLogger("bot.update_translation_status_ui")
 
@@ -135,7 +133,7 @@ def main() -> None:
     if args.template_only and args.js_only:
         raise SystemExit("--template-only and --js-only are mutually exclusive")
 
-    session = requests.Session()
+    session = build_session(cfg.mw_user_agent)
     client = MediaWikiClient(cfg.mw_api_url, cfg.mw_user_agent, session)
     client.login(cfg.mw_username, cfg.mw_password)
 
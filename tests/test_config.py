@@ -23,6 +23,8 @@ def test_load_config_reads_values(monkeypatch):
     cfg = load_config()
     assert cfg.mw_api_url.endswith("api.php")
     assert cfg.target_langs == ("sr", "it")
+    assert cfg.target_langs_sorted == ("it", "sr")
+    assert cfg.engine_langs == {"sr": "sr-Latn", "it": "it"}
     assert cfg.translate_mark_params == {"page": "{title}"}
     assert cfg.resource_row_preserve_fields == ("title", "url", "creator", "creator_link")
     assert cfg.resource_row_translate_fields == ("year", "format", "access", "tags", "notes")
@@ -0,0 +1,53 @@
+import bot.db as db
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, sql, params=None):
+        self.calls.append(params)
+
+    def fetchall(self):
+        return self.rows
+
+
+class _FakeConn:
+    def __init__(self, rows):
+        self.cur = _FakeCursor(rows)
+
+    def cursor(self):
+        return self.cur
+
+
+def test_fetch_cached_translations_keeps_matching_checksums():
+    conn = _FakeConn([("P::1", "c1", "one"), ("P::2", "old", "two")])
+
+    out = db.fetch_cached_translations(conn, {"P::1": "c1", "P::2": "c2"}, "sr")
+
+    assert conn.cur.calls == [(["P::1", "P::2"], "sr")]
+    assert out == {"P::1": "one"}
+
+
+def test_fetch_cached_translations_by_checksum_dedupes_in_one_query():
+    conn = _FakeConn([("c1", "one")])
+
+    out = db.fetch_cached_translations_by_checksum(conn, ["c1", "c2", "c1"], "sr")
+
+    assert conn.cur.calls == [(["c1", "c2"], "sr")]
+    assert out == {"c1": "one"}
+
+
+def test_fetch_cached_translations_skip_empty_input():
+    conn = _FakeConn([])
+
+    assert db.fetch_cached_translations(conn, {}, "sr") == {}
+    assert db.fetch_cached_translations_by_checksum(conn, [], "sr") == {}
+    assert conn.cur.calls == []
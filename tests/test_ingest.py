@@ -6,6 +6,7 @@ from bot.ingest import (
     is_translation_subpage,
     is_redirect_wikitext,
     ingest_all,
+    ingest_titles_bulk,
 )
 
 
@@ -63,10 +64,84 @@ def test_ingest_all_limit_updates_cursor_to_next_page(monkeypatch):
     )
     monkeypatch.setattr(
         "bot.ingest.ingest_title",
-        lambda cfg, client, conn, title, record=None, force=False, dry_run=False: None,
+        lambda cfg, client, conn, title, record=None, force=False, dry_run=False, page_records=None: None,
     )
+    monkeypatch.setattr("bot.ingest.get_pages", lambda conn, titles: {})
 
     ingest_all(object(), client, object(), limit=1)
 
     assert client.calls == [(0, 1, "cursor-start")]
     assert set_calls == [("main", "cursor-next")]
+
+
+class _TwoPageClient:
+    def __init__(self):
+        self.calls = []
+
+    def all_pages_page(self, namespace=0, limit=200, apcontinue=None):
+        self.calls.append(apcontinue)
+        if apcontinue is None:
+            return ["Page A", "Page B"], "cursor-2"
+        return ["Page C"], None
+
+
+def test_ingest_all_prefetch_keeps_page_order_and_cursors(monkeypatch):
+    client = _TwoPageClient()
+    set_calls = []
+    seen = []
+
+    monkeypatch.setattr("bot.ingest.get_ingest_cursor", lambda conn, name="main": None)
+    monkeypatch.setattr(
+        "bot.ingest.set_ingest_cursor",
+        lambda conn, name="main", apcontinue=None: set_calls.append((name, apcontinue)),
+    )
+    monkeypatch.setattr(
+        "bot.ingest.ingest_title",
+        lambda cfg, client, conn, title, record=None, force=False, dry_run=False, page_records=None: seen.append(
+            title
+        ),
+    )
+    monkeypatch.setattr("bot.ingest.get_pages", lambda conn, titles: {})
+
+    ingest_all(object(), client, object(), prefetch=True)
+
+    assert seen == ["Page A", "Page B", "Page C"]
+    assert client.calls == [None, "cursor-2"]
+    assert set_calls == [("main", "cursor-2"), ("main", None)]
+
+
+class _BulkClient:
+    def __init__(self):
+        self.bulk_calls = []
+
+    def get_page_revision_ids(self, titles):
+        self.bulk_calls.append(list(titles))
+        return {"Page A": (10, "Page A")}
+
+
+def test_ingest_titles_bulk_passes_prefetched_revisions(monkeypatch):
+    client = _BulkClient()
+    seen = []
+
+    def _fake_ingest_title(
+        cfg, client, conn, title, record=None, force=False, revision=None, page_records=None
+    ):
+        seen.append((title, revision, page_records))
+
+    def _fake_get_pages(conn, titles):
+        titles = list(titles)
+        page_queries.append(titles)
+        return {title: None for title in titles}
+
+    page_queries = []
+    monkeypatch.setattr("bot.ingest.ingest_title", _fake_ingest_title)
+    monkeypatch.setattr("bot.ingest.get_pages", _fake_get_pages)
+
+    ingest_titles_bulk(object(), client, object(), ["Page A", "Page B", "Page A"])
+
+    assert client.bulk_calls == [["Page A", "Page B"]]
+    assert page_queries == [["Page A"]]
+    assert seen == [
+        ("Page A", (10, "Page A"), {"Page A": None}),
+        ("Page B", None, {"Page A": None}),
+    ]
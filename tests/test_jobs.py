@@ -34,3 +34,21 @@ def test_next_jobs_uses_skip_locked_query():
     assert out == []
     assert "FOR UPDATE SKIP LOCKED" in " ".join(conn.cur.sql.split()).upper()
     assert conn.cur.params == (3,)
+
+
+def test_next_jobs_claims_rows_in_one_statement():
+    conn = _FakeConn()
+    out = next_jobs(conn, limit=5)
+    assert out == []
+    sql = " ".join(conn.cur.sql.split()).upper()
+    assert "SET STATUS = 'RUNNING'" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "RETURNING" in sql
+    assert conn.cur.params == (5,)
+
+
+def test_next_jobs_can_skip_older_jobs():
+    conn = _FakeConn()
+    next_jobs(conn, limit=5, after_id=41)
+    assert "AND ID > %S" in " ".join(conn.cur.sql.split()).upper()
+    assert conn.cur.params == (41, 5)
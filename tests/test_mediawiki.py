@@ -1,4 +1,6 @@
-from bot.mediawiki import MediaWikiClient, parse_translation_unit_title
+import json
+
+from bot.mediawiki import HTTP_POOL_MAXSIZE, MediaWikiClient, build_session, parse_translation_unit_title
 
 
 class FakeResponse:
@@ -8,8 +10,9 @@ class FakeResponse:
     def raise_for_status(self):
         return None
 
-    def json(self):
-        return self._payload
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode("utf-8")
 
 
 class FakeSession:
@@ -63,3 +66,90 @@ def test_request_retries_on_ratelimit():
 
     assert token == "LOGIN"
     assert len(session.requests) == 2
+
+
+def test_get_page_revision_ids_maps_requested_titles():
+    responses = [
+        {
+            "query": {
+                "normalized": [{"from": "main_Page", "to": "Main Page"}],
+                "pages": [
+                    {"title": "Main Page", "revisions": [{"revid": 42}]},
+                    {"title": "Gone", "missing": True},
+                ],
+            }
+        }
+    ]
+    session = FakeSession(responses)
+    client = MediaWikiClient("https://example.org/api.php", "ua", session)
+
+    out = client.get_page_revision_ids(["main_Page", "Gone"])
+
+    assert out == {"main_Page": (42, "Main Page")}
+    assert len(session.requests) == 1
+    assert session.requests[0][2]["titles"] == "main_Page|Gone"
+
+
+def test_get_page_props_bulk_maps_requested_titles():
+    responses = [
+        {
+            "query": {
+                "pages": [
+                    {"title": "A/sr", "pageprops": {"dr_translation_status": "reviewed"}},
+                    {"title": "B/sr"},
+                ],
+            }
+        }
+    ]
+    session = FakeSession(responses)
+    client = MediaWikiClient("https://example.org/api.php", "ua", session)
+
+    out = client.get_page_props_bulk(["A/sr", "B/sr"])
+
+    assert out == {"A/sr": {"dr_translation_status": "reviewed"}, "B/sr": {}}
+    assert session.requests[0][2]["prop"] == "pageprops"
+
+
+def test_get_pages_wikitext_skips_pages_without_content():
+    responses = [
+        {
+            "query": {
+                "pages": [
+                    {"title": "Translations:A/1/en", "revisions": [{"slots": {"main": {"content": "One"}}}]},
+                    {"title": "Translations:A/2/en"},
+                ],
+            }
+        }
+    ]
+    session = FakeSession(responses)
+    client = MediaWikiClient("https://example.org/api.php", "ua", session)
+
+    out = client.get_pages_wikitext(["Translations:A/1/en", "Translations:A/2/en"])
+
+    assert out == {"Translations:A/1/en": "One"}
+    assert session.requests[0][2]["rvprop"] == "content"
+
+
+def test_build_session_mounts_pooled_adapter():
+    session = build_session("ua")
+    adapter = session.get_adapter("https://example.org/api.php")
+
+    assert session.headers["User-Agent"] == "ua"
+    assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+    assert 503 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.is_retry("GET", 503)
+    assert not adapter.max_retries.is_retry("POST", 503)
+
+
+def test_iter_main_namespace_title_batches_spans_continuations():
+    responses = [
+        {"query": {"allpages": [{"title": "A"}, {"title": "B"}, {"title": "C"}]}, "continue": {"apcontinue": "D"}},
+        {"query": {"allpages": [{"title": "D"}, {"title": "E"}]}},
+    ]
+    session = FakeSession(responses)
+    client = MediaWikiClient("https://example.org/api.php", "ua", session)
+
+    batches = list(client.iter_main_namespace_title_batches(batch_size=2))
+
+    assert batches == [["A", "B"], ["C", "D"], ["E"]]
+    assert session.requests[1][2]["apcontinue"] == "D"
@@ -0,0 +1,10 @@
+from bot.engines.passthrough import PassthroughEngine
+
+
+def test_passthrough_engine_returns_input_in_order():
+    engine = PassthroughEngine()
+
+    out = engine.translate(["a __PH0__", "b"], "en", "sr", glossary_id="g")
+
+    assert [r.text for r in out] == ["a __PH0__", "b"]
+    assert {r.engine for r in out} == {"passthrough"}
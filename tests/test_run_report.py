@@ -3,7 +3,7 @@ import pytest
 import psycopg
 
 from bot.config import Config
-from bot.run_report import start_run, finish_run, log_item, write_report_file, report_last_run
+from bot.run_report import LogBuffer, start_run, finish_run, log_item, write_report_file, report_last_run
 
 
 @pytest.mark.skipif(not os.getenv("DATABASE_URL"), reason="DATABASE_URL not set")
@@ -64,3 +64,50 @@ def test_run_report_writes_file(tmp_path):
 
         report = report_last_run(conn)
         assert "run_id" in report
+
+
+class _BatchCursor:
+    def __init__(self):
+        self.batches = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def executemany(self, sql, rows):
+        self.batches.append(list(rows))
+
+
+class _BatchConn:
+    def __init__(self):
+        self.cur = _BatchCursor()
+
+    def cursor(self):
+        return self.cur
+
+
+def test_log_buffer_flushes_rows_in_one_batch():
+    conn = _BatchConn()
+    buffer = LogBuffer(7, max_rows=2)
+
+    buffer.add("translate", "ok", "Page", "sr")
+    assert not buffer.full
+    buffer.add("translate", "error", "Page", "it", "boom")
+    assert buffer.full
+
+    assert buffer.flush(conn) == 2
+    assert buffer.flush(conn) == 0
+    assert conn.cur.batches == [
+        [
+            (7, "translate", "Page", "sr", "ok", None),
+            (7, "translate", "Page", "it", "error", "boom"),
+        ]
+    ]
+
+
+def test_log_buffer_without_run_ignores_items():
+    buffer = LogBuffer(None)
+    buffer.add("translate", "ok", "Page", "sr")
+    assert buffer.rows == []
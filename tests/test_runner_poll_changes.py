@@ -0,0 +1,259 @@
+from types import SimpleNamespace
+
+import bot.runner as runner
+from bot.scheduler import Change
+
+
+def test_collect_poll_changes_unions_language_windows(monkeypatch):
+    cfg = SimpleNamespace(target_langs=("sr", "de"), target_langs_sorted=("de", "sr"))
+    windows = {
+        "since-de": [Change("A", 1, "2024-01-01T00:00:01Z"), Change("B", 2, "2024-01-01T00:00:03Z")],
+        "since-sr": [Change("A", 3, "2024-01-01T00:00:02Z"), Change("C", 4, "2024-01-01T00:00:04Z")],
+    }
+
+    def _fake_poll(client, since, limit=None):
+        changes = windows[since]
+        return changes, changes[-1].timestamp
+
+    monkeypatch.setattr(runner, "poll_recent_changes", _fake_poll)
+
+    changes, new_since = runner._collect_poll_changes(
+        cfg,
+        client=object(),
+        cursors={"recentchanges:de": "since-de", "recentchanges:sr": "since-sr"},
+        limit=None,
+    )
+
+    assert [(c.title, c.rev_id) for c in changes] == [("A", 3), ("B", 2), ("C", 4)]
+    assert new_since == {
+        "recentchanges:de": "2024-01-01T00:00:03Z",
+        "recentchanges:sr": "2024-01-01T00:00:04Z",
+    }
+
+
+def test_collect_poll_changes_orders_titles_by_newest_change(monkeypatch):
+    cfg = SimpleNamespace(target_langs=("sr", "de"), target_langs_sorted=("de", "sr"))
+    windows = {
+        "since-de": [Change("A", 1, "2024-01-01T00:00:01Z"), Change("A", 5, "2024-01-01T00:00:05Z")],
+        "since-sr": [Change("B", 2, "2024-01-01T00:00:02Z")],
+    }
+    monkeypatch.setattr(
+        runner,
+        "poll_recent_changes",
+        lambda client, since, limit=None: (windows[since], windows[since][-1].timestamp),
+    )
+
+    changes, _ = runner._collect_poll_changes(
+        cfg,
+        client=object(),
+        cursors={"recentchanges:de": "since-de", "recentchanges:sr": "since-sr"},
+        limit=None,
+    )
+
+    assert [(c.title, c.rev_id) for c in changes] == [("B", 2), ("A", 5)]
+
+
+def test_collect_poll_changes_breaks_timestamp_ties_by_title(monkeypatch):
+    cfg = SimpleNamespace(target_langs=("sr", "de"), target_langs_sorted=("de", "sr"))
+    ts = "2024-01-01T00:00:01Z"
+    windows = {
+        "since-de": [Change("C", 1, ts), Change("A", 2, ts)],
+        "since-sr": [Change("B", 3, ts)],
+    }
+    monkeypatch.setattr(
+        runner,
+        "poll_recent_changes",
+        lambda client, since, limit=None: (windows[since], windows[since][-1].timestamp),
+    )
+
+    changes, _ = runner._collect_poll_changes(
+        cfg,
+        client=object(),
+        cursors={"recentchanges:de": "since-de", "recentchanges:sr": "since-sr"},
+        limit=None,
+    )
+
+    assert [c.title for c in changes] == ["A", "B", "C"]
+
+
+def test_collect_poll_changes_dedupes_single_language_window(monkeypatch):
+    cfg = SimpleNamespace(target_langs=("sr",), target_langs_sorted=("sr",))
+    window = [
+        Change("A", 1, "2024-01-01T00:00:01Z"),
+        Change("B", 2, "2024-01-01T00:00:02Z"),
+        Change("A", 3, "2024-01-01T00:00:03Z"),
+    ]
+    monkeypatch.setattr(
+        runner,
+        "poll_recent_changes",
+        lambda client, since, limit=None: (window, window[-1].timestamp),
+    )
+
+    changes, new_since = runner._collect_poll_changes(
+        cfg, client=object(), cursors={}, limit=None
+    )
+
+    assert [(c.title, c.rev_id) for c in changes] == [("B", 2), ("A", 3)]
+    assert new_since == {"recentchanges:sr": "2024-01-01T00:00:03Z"}
+
+
+class _PlanClient:
+    def __init__(self, unit_keys):
+        self.unit_keys = unit_keys
+        self.fetched = []
+
+    def get_page_wikitext(self, title):
+        self.fetched.append(title)
+        if title.startswith("Translations:"):
+            return f"text {title.split('/')[-2]}", 1, title
+        return "<translate><!--T:1--> a <!--T:2--> b</translate>", 10, title
+
+    def list_translation_unit_keys(self, norm_title, source_lang="en"):
+        return list(self.unit_keys)
+
+
+def test_plan_delta_skips_unit_fetches_when_checksum_keys_differ(monkeypatch):
+    cfg = SimpleNamespace(pg_dsn="postgresql://example", source_lang="en")
+    client = _PlanClient(["1", "2", "3"])
+    monkeypatch.setattr(runner, "_load_segment_checksums", lambda cfg, title: {"1": "x"})
+
+    assert runner._plan_page_segment_delta(cfg, client, "Page") == (3, 3)
+    assert client.fetched == ["Page"]
+
+
+def test_plan_delta_counts_changed_units(monkeypatch):
+    cfg = SimpleNamespace(pg_dsn="postgresql://example", source_lang="en")
+    client = _PlanClient(["2", "1"])
+    stored = {"1": runner._checksum("text 1"), "2": "stale"}
+    monkeypatch.setattr(runner, "_load_segment_checksums", lambda cfg, title: stored)
+
+    assert runner._plan_page_segment_delta(cfg, client, "Page") == (1, 2)
+
+
+def test_plan_delta_without_db_counts_markers_only():
+    cfg = SimpleNamespace(pg_dsn="", source_lang="en")
+    client = _PlanClient(["1", "2", "3"])
+
+    assert runner._plan_page_segment_delta(cfg, client, "Page") == (2, 2)
+    assert client.fetched == ["Page"]
+
+
+def test_poll_once_pipeline_ingests_each_title_once_and_drains(monkeypatch):
+    from contextlib import contextmanager
+
+    cfg = SimpleNamespace(pg_dsn="postgresql://example", target_langs=("sr", "de"))
+    args = SimpleNamespace(
+        poll_limit=None,
+        force_retranslate=False,
+        include_missing=False,
+        max_keys=None,
+        no_cache=False,
+        rebuild_only=False,
+    )
+    windows = {
+        "since-de": [Change("A", 1, "2024-01-01T00:00:01Z")],
+        "since-sr": [Change("A", 2, "2024-01-01T00:00:02Z"), Change("B", 3, "2024-01-01T00:00:03Z")],
+    }
+    ingested = []
+    claims = [1, 0]
+
+    class _Conn:
+        def commit(self):
+            pass
+
+    @contextmanager
+    def _fake_get_conn(dsn):
+        yield _Conn()
+
+    def _fake_process_queue(cfg, client, **kwargs):
+        return claims.pop(0) if claims else 0
+
+    monkeypatch.setattr(runner, "get_conn", _fake_get_conn)
+    monkeypatch.setattr(runner, "iter_recent_changes", lambda client, since: iter(windows[since]))
+    monkeypatch.setattr(runner, "ingest_title", lambda cfg, client, conn, title, **kw: ingested.append(title))
+    monkeypatch.setattr(runner, "log_item", lambda *a, **k: None)
+    monkeypatch.setattr(runner, "count_jobs", lambda conn, status="queued", job_type=None: 0)
+    monkeypatch.setattr(runner, "process_queue", _fake_process_queue)
+    monkeypatch.setattr(runner, "max_job_id", lambda conn: 0)
+
+    new_since = runner._poll_once_pipeline(
+        cfg,
+        object(),
+        run_id=1,
+        cursors={"recentchanges:de": "since-de", "recentchanges:sr": "since-sr"},
+        args=args,
+    )
+
+    assert sorted(ingested) == ["A", "B"]
+    assert claims == []
+    assert new_since == {
+        "recentchanges:de": "2024-01-01T00:00:01Z",
+        "recentchanges:sr": "2024-01-01T00:00:03Z",
+    }
+
+
+def test_poll_once_pipeline_defers_jobs_queued_before_the_poll(monkeypatch):
+    import threading
+    from contextlib import contextmanager
+
+    cfg = SimpleNamespace(pg_dsn="postgresql://example", target_langs=("sr",))
+    args = SimpleNamespace(
+        poll_limit=None,
+        force_retranslate=True,
+        include_missing=False,
+        max_keys=None,
+        no_cache=False,
+        rebuild_only=False,
+    )
+    # T was queued by an earlier run; U is new in this poll.
+    jobs = [{"id": 1, "title": "T", "status": "queued"}]
+    translated = []
+    drain_started = threading.Event()
+    lock = threading.Lock()
+
+    class _Conn:
+        def commit(self):
+            pass
+
+    @contextmanager
+    def _fake_get_conn(dsn):
+        yield _Conn()
+
+    def _changes(client, since):
+        # Ingest only starts once the drain has already tried to claim.
+        drain_started.wait(5)
+        yield Change("T", 2, "2024-01-01T00:00:01Z")
+        yield Change("U", 3, "2024-01-01T00:00:02Z")
+
+    def _ingest(cfg, client, conn, title, **kw):
+        # enqueue_job semantics: only a 'queued' row blocks a new one.
+        with lock:
+            if not any(j["title"] == title and j["status"] == "queued" for j in jobs):
+                jobs.append({"id": len(jobs) + 1, "title": title, "status": "queued"})
+
+    def _process_queue(cfg, client, after_job_id=None, **kwargs):
+        drain_started.set()
+        with lock:
+            claim = [
+                j for j in jobs
+                if j["status"] == "queued" and (after_job_id is None or j["id"] > after_job_id)
+            ]
+            for job in claim:
+                job["status"] = "done"
+        translated.extend(job["title"] for job in claim)
+        return len(claim)
+
+    monkeypatch.setattr(runner, "get_conn", _fake_get_conn)
+    monkeypatch.setattr(runner, "iter_recent_changes", _changes)
+    monkeypatch.setattr(runner, "ingest_title", _ingest)
+    monkeypatch.setattr(runner, "log_item", lambda *a, **k: None)
+    monkeypatch.setattr(runner, "count_jobs", lambda conn, status="queued", job_type=None: 0)
+    monkeypatch.setattr(runner, "process_queue", _process_queue)
+    monkeypatch.setattr(runner, "max_job_id", lambda conn: max(j["id"] for j in jobs))
+    monkeypatch.setattr(runner, "POLL_PIPELINE_IDLE_SECONDS", 0.01)
+
+    runner._poll_once_pipeline(
+        cfg, object(), run_id=1, cursors={"recentchanges:sr": None}, args=args
+    )
+
+    assert sorted(translated) == ["T", "U"]
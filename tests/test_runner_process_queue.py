@@ -10,6 +10,7 @@ def test_process_queue_marks_job_error_on_system_exit(monkeypatch):
         pg_dsn="postgresql://example",
         target_langs=("sr",),
         source_lang="en",
+        engine_langs={"sr": "sr-Latn"},
     )
     marks: dict[str, list[tuple[int, str]]] = {"done": [], "error": []}
 
@@ -18,16 +19,18 @@ def test_process_queue_marks_job_error_on_system_exit(monkeypatch):
         assert dsn == cfg.pg_dsn
         yield object()
 
-    def _raise_system_exit():
+    def _raise_system_exit(args, cfg=None, client=None):
+        assert args.title == "Main Page"
+        assert args.engine_lang == "sr-Latn"
         raise SystemExit("no segments found")
 
     monkeypatch.setattr(runner, "get_conn", _fake_get_conn)
     monkeypatch.setattr(
         runner,
         "next_jobs",
-        lambda conn, limit=5: [Job(7, "translate_page", "Main Page", "sr", "queued", 0, 0)],
+        lambda conn, limit=5, after_id=None: [Job(7, "translate_page", "Main Page", "sr", "queued", 0, 0)],
     )
-    monkeypatch.setattr(runner, "translate_page_main", _raise_system_exit)
+    monkeypatch.setattr(runner, "translate_page_run", _raise_system_exit)
     monkeypatch.setattr(runner, "mark_job_done", lambda conn, job_id: marks["done"].append((job_id, "")))
     monkeypatch.setattr(
         runner,
@@ -35,7 +38,61 @@ def test_process_queue_marks_job_error_on_system_exit(monkeypatch):
         lambda conn, job_id, error: marks["error"].append((job_id, error)),
     )
 
-    runner.process_queue(cfg, client=object())
+    assert runner.process_queue(cfg, client=object()) == 1
 
     assert marks["done"] == []
     assert marks["error"] == [(7, "no segments found")]
+
+
+def test_drain_queue_stops_on_empty_claim(monkeypatch):
+    batches = [5, 2, 0, 4]
+    calls = []
+
+    def _fake_process_queue(cfg, client, **kwargs):
+        calls.append(kwargs["run_id"])
+        return batches[len(calls) - 1]
+
+    monkeypatch.setattr(runner, "process_queue", _fake_process_queue)
+
+    runner._drain_queue(SimpleNamespace(), client=object(), run_id=3, progress=None)
+
+    assert calls == [3, 3, 3]
+
+
+def test_retry_approve_releases_connection_between_pages(monkeypatch):
+    cfg = SimpleNamespace(pg_dsn="postgresql://example", target_langs=("sr",))
+    pages = {
+        None: [("A", "sr"), ("B", "de")],
+        ("B", "de"): [("C", "sr")],
+    }
+    open_conns = []
+    events = []
+
+    @contextmanager
+    def _fake_get_conn(dsn):
+        open_conns.append(dsn)
+        yield object()
+        open_conns.pop()
+
+    def _fetch(conn, run_id, after=None, limit=1000):
+        assert run_id == 4
+        return pages[after]
+
+    def _approve(args, cfg=None, client=None):
+        assert open_conns == []
+        events.append(("approve", args.title))
+        return {"approve_status": "ok"}
+
+    monkeypatch.setattr(runner, "APPROVE_PAIRS_BATCH", 2)
+    monkeypatch.setattr(runner, "get_conn", _fake_get_conn)
+    monkeypatch.setattr(runner, "fetch_translate_ok_pairs", _fetch)
+    monkeypatch.setattr(runner, "translate_page_run", _approve)
+    monkeypatch.setattr(
+        runner,
+        "log_item",
+        lambda conn, run_id, kind, status, title, lang, message: events.append(("log", title)),
+    )
+
+    runner.retry_approve_from_run(cfg, client=object(), source_run_id=4, log_run_id=9)
+
+    assert events == [("approve", "A"), ("log", "A"), ("approve", "C"), ("log", "C")]
@@ -0,0 +1,24 @@
+from bot.segmenter import Segment, split_translate_units
+
+
+def test_split_translate_units_strips_tags_and_skips_empty_units():
+    text = (
+        "<translate>\n<!--T:1-->\nHello\n\n<!--T:2-->\n</translate>\n"
+        "<translate><!--T:3--> World </translate>"
+    )
+    assert split_translate_units(text) == [
+        Segment(key="1", text="Hello"),
+        Segment(key="3", text="World"),
+    ]
+
+
+def test_split_translate_units_without_markers():
+    assert split_translate_units("<translate>plain</translate>") == []
+
+
+def test_split_translate_units_drops_tags_inside_units():
+    text = "<!--T:1-->Hello </translate>mid<translate> world<!--T:2-->x"
+    assert split_translate_units(text) == [
+        Segment(key="1", text="Hello mid world"),
+        Segment(key="2", text="x"),
+    ]
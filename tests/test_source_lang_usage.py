@@ -11,6 +11,10 @@ class _UnitClient:
         self.unit_titles.append(title)
         return "Segment text", 100, title
 
+    def get_pages_wikitext(self, titles: list[str]):
+        self.unit_titles.extend(titles)
+        return {title: "Segment text" for title in titles}
+
 
 def test_fetch_unit_sources_uses_configured_source_lang():
     client = _UnitClient()
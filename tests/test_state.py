@@ -0,0 +1,60 @@
+from bot.state import get_ingest_cursors, set_ingest_cursors, set_status_sync_revs
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, sql, params=None):
+        self.calls.append((sql, params))
+
+    def executemany(self, sql, params_seq):
+        self.calls.append((sql, list(params_seq)))
+
+    def fetchall(self):
+        return self.rows
+
+
+class _FakeConn:
+    def __init__(self, rows=None):
+        self.cur = _FakeCursor(rows or [])
+
+    def cursor(self):
+        return self.cur
+
+
+def test_get_ingest_cursors_reads_all_names_in_one_query():
+    conn = _FakeConn(rows=[("recentchanges:sr", "2024-01-01T00:00:00Z")])
+
+    out = get_ingest_cursors(conn, ["recentchanges:it", "recentchanges:sr"])
+
+    assert out == {"recentchanges:it": None, "recentchanges:sr": "2024-01-01T00:00:00Z"}
+    assert len(conn.cur.calls) == 1
+    assert conn.cur.calls[0][1] == (["recentchanges:it", "recentchanges:sr"],)
+
+
+def test_set_ingest_cursors_writes_all_cursors_in_one_batch():
+    conn = _FakeConn()
+
+    set_ingest_cursors(conn, {"recentchanges:it": "t1", "recentchanges:sr": None})
+    set_ingest_cursors(conn, {})
+
+    assert len(conn.cur.calls) == 1
+    sql, rows = conn.cur.calls[0]
+    assert "ON CONFLICT (name)" in sql
+    assert rows == [("recentchanges:it", "t1"), ("recentchanges:sr", None)]
+
+
+def test_set_status_sync_revs_skips_empty_rows():
+    conn = _FakeConn()
+
+    set_status_sync_revs(conn, [])
+
+    assert conn.cur.calls == []
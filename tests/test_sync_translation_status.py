@@ -10,14 +10,15 @@ class _FakeClient:
     def login(self, username: str, password: str) -> None:
         _ = username, password
 
-    def iter_main_namespace_titles(self):
-        return ["Source", "Source/fr"]
+    def iter_main_namespace_title_batches(self):
+        yield ["Source", "Source/fr"]
 
-    def get_page_revision_id(self, title: str):
-        self.revision_requests.append(title)
-        if title == "Source":
-            return 100, "Source"
-        raise RuntimeError("missing")
+    def get_page_revision_ids(self, titles: list[str]):
+        self.revision_requests.extend(titles)
+        return {title: (100, title) for title in titles if title == "Source"}
+
+    def get_page_props_bulk(self, titles: list[str]):
+        return {title: {} for title in titles}
 
 
 def test_sync_translation_status_skips_translation_subpages(monkeypatch):
@@ -29,6 +30,7 @@ def test_sync_translation_status_skips_translation_subpages(monkeypatch):
         mw_password="secret",
         target_langs=("sr", "it"),
         source_lang="en",
+        pg_dsn="",
     )
 
     monkeypatch.setattr(sync_translation_status, "configure_logging", lambda: None)
@@ -41,9 +43,130 @@ def test_sync_translation_status_skips_translation_subpages(monkeypatch):
             langs=None,
             approve=False,
             dry_run=True,
+            no_cache=False,
         ),
     )
 
     sync_translation_status.main()
 
     assert "Source/fr" not in fake.revision_requests
+
+
+def test_iter_source_revisions_batches_lookups_and_props():
+    class _BatchClient:
+        def __init__(self):
+            self.calls: list[list[str]] = []
+
+        def get_page_revision_ids(self, titles):
+            self.calls.append(list(titles))
+            known = {"A": (1, "A"), "b": (2, "B"), "A/sr": (11, "A/sr"), "B/it": (22, "B/it")}
+            return {title: known[title] for title in titles if title in known}
+
+        def get_page_props_bulk(self, titles):
+            self.calls.append(list(titles))
+            return {"A/sr": {"dr_translation_status": "reviewed"}}
+
+    client = _BatchClient()
+
+    rows = list(sync_translation_status.iter_source_revisions(client, [["A", "b", "Gone"]], ("sr", "it")))
+
+    assert rows == [
+        (1, "A", {"A/sr": (11, {"dr_translation_status": "reviewed"})}),
+        (2, "B", {"B/it": (22, {})}),
+    ]
+    assert client.calls == [["A", "b", "Gone"], ["A/sr", "A/it", "B/sr", "B/it"], ["A/sr", "B/it"]]
+
+
+def test_sync_page_counts_reviewed_page_in_dry_run():
+    class _PageClient:
+        def get_ai_translation_info(self, title):
+            return {"status": "reviewed"}
+
+        def get_page_wikitext(self, title):
+            return "{{Translation_status|status=reviewed}}\nBody", 5, title
+
+    cfg = SimpleNamespace(source_lang="en")
+    args = SimpleNamespace(dry_run=True, approve=True)
+
+    counts = sync_translation_status._sync_page(cfg, _PageClient(), args, "100", "Source", "sr", {})
+
+    assert counts["scanned"] == 1
+    assert counts["errors"] == 0
+    assert counts["approved"] == 0
+
+
+def test_sync_page_skips_unit1_fallback_when_metadata_has_no_status(monkeypatch):
+    class _PageClient:
+        def get_ai_translation_info(self, title):
+            return {"source_rev": "90"}
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("unit1 fallback should not run")
+
+    monkeypatch.setattr(sync_translation_status, "_translation_status_from_unit1", _fail)
+    cfg = SimpleNamespace(source_lang="en")
+    args = SimpleNamespace(dry_run=True, approve=False)
+
+    counts = sync_translation_status._sync_page(cfg, _PageClient(), args, "100", "Source", "sr", {})
+
+    assert counts == {"scanned": 1, "skipped": 1}
+
+
+def test_reviewed_template_in_place():
+    in_place = sync_translation_status._reviewed_template_in_place
+
+    assert in_place("{{Translation_status|status=reviewed}}Body\n\n\n\nMore")
+    assert not in_place("{{Translation_status|status=machine}}Body")
+    assert not in_place("Body\n{{Translation_status|status=reviewed}}")
+    assert not in_place("{{Translation_status|status=reviewed}}Body{{Translation_status|status=machine}}")
+    assert not in_place('{{Translation_status|status=reviewed}}{| class="translation-disclaimer"\n|}')
+
+
+def test_sync_translation_status_skips_pages_with_unchanged_revisions(monkeypatch, capsys):
+    from contextlib import contextmanager
+
+    class _AllFoundClient(_FakeClient):
+        def get_page_revision_ids(self, titles):
+            return {title: (100, title) for title in titles}
+
+    cfg = SimpleNamespace(
+        mw_api_url="https://example.org/api.php",
+        mw_user_agent="ua",
+        mw_username="bot",
+        mw_password="secret",
+        target_langs=("sr", "it"),
+        source_lang="en",
+        pg_dsn="postgresql://example",
+    )
+    stored = []
+    synced_pages = []
+
+    @contextmanager
+    def _fake_get_conn(dsn):
+        yield object()
+
+    def _fake_sync_page(cfg, client, args, source_rev_s, norm_title, lang, props):
+        synced_pages.append((norm_title, lang))
+        return sync_translation_status.Counter(scanned=1, synced=1)
+
+    monkeypatch.setattr(sync_translation_status, "configure_logging", lambda: None)
+    monkeypatch.setattr(sync_translation_status, "load_config", lambda: cfg)
+    monkeypatch.setattr(sync_translation_status, "MediaWikiClient", lambda *args, **kwargs: _AllFoundClient())
+    monkeypatch.setattr(sync_translation_status, "get_conn", _fake_get_conn)
+    monkeypatch.setattr(
+        sync_translation_status, "get_status_sync_revs", lambda conn: {("Source", "sr"): (100, 100)}
+    )
+    monkeypatch.setattr(sync_translation_status, "set_status_sync_revs", lambda conn, rows: stored.extend(rows))
+    monkeypatch.setattr(sync_translation_status, "_sync_page", _fake_sync_page)
+    monkeypatch.setattr(
+        "argparse.ArgumentParser.parse_args",
+        lambda self: SimpleNamespace(
+            only_title="Source", langs=None, approve=False, dry_run=False, no_cache=False
+        ),
+    )
+
+    sync_translation_status.main()
+
+    assert synced_pages == [("Source", "it")]
+    assert stored == [("Source", "it", 100, 100)]
+    assert "cached=1" in capsys.readouterr().out
@@ -0,0 +1,59 @@
+import bot.tracker as tracker
+
+
+class _FakeCursor:
+    def __init__(self):
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def executemany(self, sql, params_seq):
+        self.calls.append(list(params_seq))
+
+    def execute(self, sql, params=None):
+        self.calls.append(params)
+
+    def fetchall(self):
+        return [("A", "en", 5)]
+
+
+class _FakeConn:
+    def __init__(self):
+        self.cur = _FakeCursor()
+        self.cursors_opened = 0
+
+    def cursor(self):
+        self.cursors_opened += 1
+        return self.cur
+
+
+def test_upsert_pages_chunks_rows(monkeypatch):
+    monkeypatch.setattr(tracker, "UPSERT_PAGES_CHUNK", 2)
+    conn = _FakeConn()
+    rows = [("A", "en", 1), ("B", "en", 2), ("C", "en", 3)]
+
+    tracker.upsert_pages(conn, iter(rows))
+
+    assert conn.cur.calls == [rows[:2], rows[2:]]
+    assert conn.cursors_opened == 1
+
+
+def test_upsert_pages_skips_empty_input():
+    conn = _FakeConn()
+
+    tracker.upsert_pages(conn, [])
+
+    assert conn.cursors_opened == 0
+
+
+def test_get_pages_reads_all_titles_in_one_query():
+    conn = _FakeConn()
+
+    out = tracker.get_pages(conn, ["A", "B", "A"])
+
+    assert conn.cur.calls == [(["A", "B"],)]
+    assert out == {"A": tracker.PageRecord("A", "en", 5), "B": None}
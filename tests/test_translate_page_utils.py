@@ -1,9 +1,16 @@
+import pytest
+
+import bot.translate_page as translate_page
 from bot.translate_page import (
+    _build_parser,
+    build_args,
     _protect_terms,
+    _terms_re,
     assemble_translated_page,
     _strip_empty_paragraphs,
     _apply_termbase,
     _apply_termbase_safe,
+    _present_termbase_pairs,
     _is_redirect_wikitext,
     _missing_required_tokens,
     _strip_unresolved_placeholders,
@@ -15,15 +22,21 @@ from bot.translate_page import (
     _source_title_for_displaytitle,
     _normalize_leading_status_directives,
     _compact_leading_metadata_preamble,
+    _collapse_blank_lines,
+    _normalize_leading_div,
     _upsert_status_template,
     _toggle_trailing_newline,
     _normalize_heading_body_spacing,
     _rewrite_internal_links_to_lang_with_source,
+    _finalize_links,
+    _restore_all,
     _restore_category_namespace,
     _translate_resource_row_templates,
     _restore_resource_row_preserve_fields,
     _localize_resource_row_internal_targets,
 )
+from bot.engines.base import TranslationResult
+from bot.placeholders import protect_wikitext
 from bot.segmenter import Segment
 
 
@@ -41,6 +54,26 @@ def test_protect_terms_respects_word_boundaries():
     assert placeholders == {"__NT0__": "DOG"}
 
 
+@pytest.mark.parametrize("protect", [True, False])
+def test_terms_re_prefers_longest_term_and_maps_lastindex(protect):
+    terms = ("dance floor", "dance", "floor")
+    replacements = ("PLESNI PODIJ", "PLES", "POD")
+    pattern = _terms_re(terms, protect)
+    text = "Dance floor, dance and floors; dance-floor"
+
+    hits = [(m.group(0), m.lastindex) for m in pattern.finditer(text)]
+    out = pattern.sub(lambda m: replacements[m.lastindex - 1], text)
+
+    assert hits == [("Dance floor", 1), ("dance", 2), ("dance", 2), ("floor", 3)]
+    assert out == "PLESNI PODIJ, PLES and floors; PLES-POD"
+
+
+def test_protect_terms_prefers_longest_term():
+    protected, placeholders = _protect_terms("Dance practice and dance", [("dance", "D"), ("dance practice", "DP")])
+    assert protected == "__NT0__ and __NT1__"
+    assert placeholders == {"__NT0__": "DP", "__NT1__": "D"}
+
+
 def test_assemble_translated_page_replaces_marked_units():
     wikitext = "<translate>\n<!--T:1-->One\n<!--T:2-->Two\n</translate>\n"
     out = assemble_translated_page(
@@ -53,15 +86,42 @@ def test_assemble_translated_page_replaces_marked_units():
     assert out == "Uno\nDos\n"
 
 
+def test_apply_termbase_single_pass_leftmost_match_without_chaining():
+    # One alternation pass: the leftmost match wins regardless of termbase
+    # order, and replaced text is not matched again by later entries.
+    overlapping = [{"term": "bar", "preferred": "X"}, {"term": "foo bar", "preferred": "Y"}]
+    assert _apply_termbase("foo bar", overlapping) == "Y"
+    chained = [{"term": "colour", "preferred": "color"}, {"term": "color", "preferred": "boja"}]
+    assert _apply_termbase("colour color", chained) == "color boja"
+
+
 def test_apply_termbase():
     entries = [{"term": "kuriranih", "preferred": "odabranih"}]
     assert _apply_termbase("Biblioteka kuriranih resursa", entries) == "Biblioteka odabranih resursa"
+    entries = [{"term": "ab", "preferred": "X"}, {"term": "cd", "preferred": "Y"}, {"term": "", "preferred": "Z"}]
+    assert _apply_termbase("AB cd abc", entries) == "X Y abc"
     text = "[[Conscious Dance Practices/5Rhythms/sr|5Rhythms]]"
     entries = [{"term": "5Rhythms", "preferred": "5Ritmova"}]
     assert (
         _apply_termbase_safe(text, entries)
         == "[[Conscious Dance Practices/5Rhythms/sr|5Ritmova]]"
     )
+    text = "[[Page|Other]]"
+    assert _apply_termbase_safe(text, entries) is text
+
+
+def test_present_termbase_pairs_keeps_case_insensitive_candidates():
+    pairs = [("5Rhythms", "5Ritmova"), ("İstanbul", "Istanbul"), ("waves", "talasi")]
+    assert _present_termbase_pairs("5RHYTHMS in istanbul", pairs) == pairs[:2]
+    assert _present_termbase_pairs("nothing here", pairs) == []
+
+
+def test_restore_all_expands_nested_placeholders():
+    source = "{{Note|<ref>Cite</ref>}} text __NOTOC__<ref>B</ref>"
+    ph = protect_wikitext(source, protect_links=False)
+    assert ph.placeholders["__PH3__"] == "{{Note|__PH0__}}"
+    assert _restore_all(ph.text, ph.placeholders) == source
+    assert _restore_all("plain", {}) == "plain"
 
 
 def test_is_redirect_wikitext():
@@ -75,6 +135,10 @@ def test_strip_unresolved_placeholders():
     assert _strip_unresolved_placeholders(text) == "Hello  world "
 
 
+def test_strip_unresolved_placeholders_removes_tokens_joined_by_removal():
+    assert _strip_unresolved_placeholders("a __PH__PH1__0__ b") == "a  b"
+
+
 def test_fix_broken_links():
     text = "[[__PH0__|Arjan Bouw]]"
     assert _fix_broken_links(text, "sr") == "[[Arjan Bouw/sr|Arjan Bouw]]"
@@ -86,6 +150,18 @@ def test_restore_file_links():
     assert _restore_file_links(source, translated) == source
 
 
+def test_restore_file_links_pairs_by_position():
+    source = "[[File:A.jpg|thumb]] x [[File:B.jpg|thumb]]"
+    translated = "[[File:A.jpg|slika]] x [[File:A.jpg|slika]]"
+    assert _restore_file_links(source, translated) == source
+
+
+def test_restore_file_links_returns_restored_text_unchanged():
+    source = "[[File:A.jpg|thumb]] x"
+    translated = "[[File:A.jpg|thumb]] y [[File:C.jpg]]"
+    assert _restore_file_links(source, translated) is translated
+
+
 def test_restore_html_tags_preserves_class_names():
     source = '<div class="dr-hero"><div class="dr-hero-inner">Text</div></div>'
     translated = '<div class="dr-eroe"><div class="dr-eroe-interno">Testo</div></div>'
@@ -136,6 +212,16 @@ def test_normalize_leading_status_directives():
     )
 
 
+def test_collapse_blank_lines():
+    assert _collapse_blank_lines("\n\na\n\n\n\nb\n\n\nc\n\nd") == "a\n\nb\n\nc\n\nd"
+
+
+def test_normalize_leading_div():
+    text = "{{DISPLAYTITLE:X}}\n\n__NOTOC__\n\n<div class=\"a\">Body</div>"
+    assert _normalize_leading_div(text) == "{{DISPLAYTITLE:X}}\n\n__NOTOC__<div class=\"a\">Body</div>"
+    assert _normalize_leading_div("__NOTOC__\n<div>") == "__NOTOC__<div>"
+
+
 def test_tokenize_links_keeps_label_translatable_and_protects_markup():
     text = "[[Conscious Dance Practices/InnerMotion/The Guidebook|reading the InnerMotion Guidebook]]"
     tokenized, placeholders, _, _, required = _tokenize_links(text, "it")
@@ -224,6 +310,17 @@ def test_rewrite_internal_links_upgrades_explicit_source_label_to_localized():
     assert out == "[[Core Values/pt|Valores Essenciais]]"
 
 
+def test_finalize_links_applies_display_broken_and_lang_rewrites():
+    text = "[[Core Values]] [[__PH0__|Arjan Bouw]] [[Manifesto|Manifesto]]"
+    out = _finalize_links(
+        text,
+        "sr",
+        {"Core Values", "Manifesto"},
+        display_by_target={"Manifesto": "Manifest"},
+    )
+    assert out == "[[Core Values/sr|Core Values]] [[Arjan Bouw/sr|Arjan Bouw]] [[Manifesto/sr|Manifest]]"
+
+
 def test_restore_category_namespace():
     source = "[[Category:Conscious Dance Practices]]\n[[Category:Dance Meditation]]"
     translated = "[[Categoria:Práticas de Dança Consciente]]\n[[Categoria:Meditação pela Dança]]"
@@ -332,3 +429,45 @@ def test_localize_resource_row_internal_targets_keeps_external_url():
     )
     assert "| url = https://example.org/some/path" in out
     assert "| creator_link = Milos_Gacanovic/sr" in out
+
+
+def test_build_args_matches_cli_defaults():
+    args = build_args("Main Page", lang="it", auto_approve=True)
+    cli = _build_parser().parse_args(["--title", "Main Page", "--lang", "it", "--auto-approve"])
+
+    assert vars(args) == vars(cli)
+    with pytest.raises(TypeError):
+        build_args("Main Page", not_an_option=True)
+
+
+def test_edit_pacer_spaces_calls(monkeypatch):
+    clock = {"now": 100.0}
+    sleeps: list[float] = []
+
+    def _sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(translate_page.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(translate_page.time, "sleep", _sleep)
+    pacer = translate_page._EditPacer(0.5)
+    pacer.wait()
+    pacer.wait()
+    clock["now"] += 2.0
+    pacer.wait()
+
+    assert sleeps == [0.5]
+
+
+def test_translate_unique_sends_repeated_texts_once():
+    calls = []
+
+    class _Engine:
+        def translate(self, texts, source_lang, target_lang, glossary_id=None):
+            calls.append(list(texts))
+            return [TranslationResult(text=t.upper(), engine="fake") for t in texts]
+
+    out = translate_page._translate_unique(_Engine(), ["a", "b", "a"], "en", "sr")
+
+    assert calls == [["a", "b"]]
+    assert [r.text for r in out] == ["A", "B", "A"]
@@ -1,4 +1,11 @@
 from bot.translate_page import (
+    _collapse_blank_lines,
+    _compact_leading_metadata_preamble,
+    _equal_ignoring_edge_ws,
+    _normalize_leading_directives,
+    _normalize_leading_div,
+    _normalize_leading_status_directives,
+    _normalize_unit1,
     _parse_status_template,
     _upsert_status_template,
     _remove_disclaimer_tables,
@@ -37,6 +44,24 @@ def test_remove_disclaimer_tables():
     assert _remove_disclaimer_tables(text) == "Body"
 
 
+def test_normalize_unit1_matches_sequential_helpers():
+    samples = [
+        "",
+        "Plain body\n\n\n\nmore",
+        "{{Translation_status|status=reviewed}}\n{{DISPLAYTITLE:X}}\n\n__NOTOC__\n\n[[File:a.png]]\n\nBody",
+        "{{displaytitle:x}}\n__notoc__\n\n<div>Body</div>",
+        "{| class=\"translation-disclaimer\"\n|-\n| old\n|}\n\n__NOTOC__\n<div>Body</div>",
+    ]
+    for text in samples:
+        expected = _remove_disclaimer_tables(text)
+        expected = _normalize_leading_directives(expected)
+        expected = _normalize_leading_status_directives(expected)
+        expected = _normalize_leading_div(expected)
+        expected = _compact_leading_metadata_preamble(expected)
+        expected = _collapse_blank_lines(expected)
+        assert _normalize_unit1(text) == expected
+
+
 def test_translation_status_from_ai_info_maps_expected_fields():
     info = {
         "status": "machine",
@@ -51,3 +76,9 @@ def test_translation_status_from_ai_info_maps_expected_fields():
     assert out["dr_reviewed_by"] == "Admin"
     assert out["dr_reviewed_at"] == "2026-02-12"
     assert "dr_outdated_source_rev" not in out
+
+
+def test_equal_ignoring_edge_ws_matches_strip_compare():
+    pairs = [("a", "a"), ("  a\n", "a"), ("a b", "a  b"), ("\n\n", ""), ("x\n", "\ny"), ("ab ", " abc")]
+    for a, b in pairs:
+        assert _equal_ignoring_edge_ws(a, b) == (a.strip() == b.strip())